@@ -0,0 +1,93 @@
+# _static.py
+import os
+
+import streamlit as st
+from PIL import Image
+
+try:
+    from markdown_it import MarkdownIt
+except ImportError:
+    # markdown-it-py not installed; callers fall back to st.markdown
+    MarkdownIt = None
+
+# PNG favicon loaded once at import; Streamlit caches the Pillow object
+# by identity, avoiding the emoji-to-image fallback in the browser
+_ICON_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".streamlit", "static", "ph_flag.png")
+try:
+    PAGE_ICON = Image.open(_ICON_PATH)
+except OSError:
+    PAGE_ICON = "🇵🇭"
+
+# Page configuration shared by the home entrypoint; built once at import
+# instead of re-allocating the kwargs dict on every rerun
+PAGE_CFG = {
+    "page_title": "Filipino Migrators Dashboard",
+    "page_icon": PAGE_ICON,
+    "layout": "wide",
+    "initial_sidebar_state": "expanded",
+}
+
+# Custom CSS lives in .streamlit/static/home.css and is served through
+# Streamlit's static file mount ([server] enableStaticServing), so the
+# browser caches it instead of receiving the rules inline on every run
+CSS = "<link rel='stylesheet' href='app/static/home.css'>"
+
+# Emoji pre-encoded as HTML numeric character references so the markdown
+# pipeline skips emoji/shortcode detection when rendering the HTML blobs
+BAR_CHART = "&#x1F4CA;"    # 📊
+WORLD_MAP = "&#x1F5FA;&#xFE0F;"  # 🗺️
+TREND_UP = "&#x1F4C8;"     # 📈
+
+# Intro cards as plain HTML joined into one flexbox container: a single
+# frontend element instead of three st.columns containers mounted per rerun
+CARDS = (
+    f'<h3>{BAR_CHART} Dashboard</h3>'
+    '<p>Get a comprehensive overview of Filipino migration statistics and key metrics.</p>',
+    f'<h3>{WORLD_MAP} Migration Pattern</h3>'
+    '<p>Explore detailed migration trends by region, country, and time period.</p>',
+    f'<h3>{TREND_UP} Related Dataset</h3>'
+    '<p>Compare and analyze multiple variables across different regions and countries.</p>',
+)
+
+# Entire sidebar scaffold (title, navigation header, divider, hint) as
+# one precomputed blob: a single frontend element per rerun instead of
+# separate title/markdown/info elements
+SIDEBAR_HTML = (
+    '<h3>Navigation</h3>'
+    '<hr style="margin:0.5rem 0">'
+    '<div style="background:rgba(96,165,250,0.08);border:1px solid #1e3a8a;'
+    'border-radius:8px;padding:0.75rem 1rem;font-size:0.9rem">'
+    'Select a page above to explore different aspects of Filipino migration data.'
+    '</div>'
+)
+
+INTRO_HTML = (
+    '<div style="display:flex;gap:1rem">'
+    + ''.join(f'<div style="flex:1">{card}</div>' for card in CARDS)
+    + '</div>'
+)
+
+ABOUT_HTML = """
+This interactive application provides comprehensive insights into Filipino migration patterns worldwide.
+Analyze trends, explore regional differences, and discover meaningful patterns in the data.
+
+**👈 Get started by selecting a page from the sidebar!**
+"""
+
+
+@st.cache_data
+def render_md(src: str) -> str:
+    """Render a Markdown source string to HTML once and cache the result."""
+    return MarkdownIt().render(src)
+
+
+@st.cache_resource
+def get_static_html() -> dict:
+    """Build the static HTML blobs for the home page once per session."""
+    return {
+        "css": CSS,
+        "sidebar": SIDEBAR_HTML,
+        "intro": INTRO_HTML,
+        "about": ABOUT_HTML,
+    }
@@ -0,0 +1,57 @@
+# build_home.py
+"""Prerender the static body of the home page.
+
+The welcome page has no reactive state, so its markdown can be rendered
+to plain HTML ahead of time instead of being re-parsed by the Streamlit
+frontend on every rerun. Run this once at build/deploy time:
+
+    python build_home.py
+
+The output lands in .streamlit/static/home.html and is injected by
+layout.render_home() via streamlit.components.v1.html.
+"""
+import os
+
+OUTPUT_PATH = os.path.join(".streamlit", "static", "home.html")
+
+HOME_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<style>
+body { font-family: "Source Sans Pro", sans-serif; color: #e5e5e2; background: transparent; margin: 0; }
+h3 { margin-bottom: 0.4rem; }
+hr { border: none; border-top: 1px solid #343330; margin: 1.5rem 0; }
+.intro { display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; }
+.footer { color: #666; font-size: 0.85rem; }
+</style>
+</head>
+<body>
+<div class="intro">
+<div><h3>&#x1F4CA; Dashboard</h3>
+<p>Get a comprehensive overview of Filipino migration statistics and key metrics.</p></div>
+<div><h3>&#x1F5FA;&#xFE0F; Migration Pattern</h3>
+<p>Explore detailed migration trends by region, country, and time period.</p></div>
+<div><h3>&#x1F4C8; Related Dataset</h3>
+<p>Compare and analyze multiple variables across different regions and countries.</p></div>
+</div>
+<hr>
+<h3>About This Dashboard</h3>
+<p>This interactive application provides comprehensive insights into Filipino migration patterns worldwide.
+Analyze trends, explore regional differences, and discover meaningful patterns in the data.</p>
+<p><strong>&#x1F448; Get started by selecting a page from the sidebar!</strong></p>
+<hr>
+<p class="footer">Data Source: Filipino Migration Statistics | Last Updated: 2022</p>
+</body>
+</html>
+"""
+
+
+def build(output_path=OUTPUT_PATH):
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(HOME_HTML)
+    return output_path
+
+
+if __name__ == "__main__":
+    print(f"Wrote {build()}")
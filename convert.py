@@ -0,0 +1,35 @@
+# convert.py
+"""One-off CSV -> Parquet conversion for the dashboard datasets.
+
+Parquet loads are columnar and pre-typed, so the Streamlit pages warm
+their caches much faster than with CSV parsing. Re-run this after
+updating any of the source CSVs:
+
+    python convert.py
+"""
+import pandas as pd
+
+CONVERSIONS = [
+    ("data/Matthew/all_countries_supplementary_updated.csv",
+     "data/Matthew/all_countries_supplementary_updated.parquet"),
+    ("data/merged_data.csv", "data/merged_data.parquet"),
+    ("data/raph/clean_migration_origin_destination.csv",
+     "data/raph/clean_migration_origin_destination.parquet"),
+    ("data/educ_pivot.csv", "data/educ_pivot.parquet"),
+    ("data/age_pivot.csv", "data/age_pivot.parquet"),
+    ("data/occu_pivot.csv", "data/occu_pivot.parquet"),
+    ("data/countries_pivot.csv", "data/countries_pivot.parquet"),
+    ("data/sex_pivot.csv", "data/sex_pivot.parquet"),
+    ("data/civ_pivot.csv", "data/civ_pivot.parquet"),
+    ("data/regions_pivot.csv", "data/regions_pivot.parquet"),
+]
+
+
+def convert():
+    for csv_path, parquet_path in CONVERSIONS:
+        pd.read_csv(csv_path).to_parquet(parquet_path, compression="zstd")
+        print(f"Wrote {parquet_path}")
+
+
+if __name__ == "__main__":
+    convert()
@@ -1,8 +1,10 @@
 # educ_occ_heatmap.py
+import functools
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 
 # ------------------------
@@ -11,7 +13,20 @@ import numpy as np
 
 
 def load_data(path="data/merged_data.csv"):
-    df = pd.read_csv(path)
+    # keyed on mtime so edits to the CSV invalidate the cached frame
+    return _load_data(path, os.path.getmtime(path))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_data(path, mtime):
+    # only the year + count columns, with explicit dtypes so the parser
+    # skips inference on every other column in the file; counts stay
+    # float32 (the raw CSV has gaps that become 0 below)
+    wanted = {"year", *EDUCATION_COLS, *OCCUPATION_COLS}
+    df = pd.read_csv(
+        path,
+        usecols=lambda c: c in wanted,
+        dtype={c: "float32" for c in (*EDUCATION_COLS, *OCCUPATION_COLS)})
     if "year" in df.columns:
         df["year"] = pd.to_numeric(
             df["year"], errors="coerce").fillna(0).astype(int)
@@ -27,9 +42,14 @@ def load_data(path="data/merged_data.csv"):
 
 
 def available_years(data_path="data/merged_data.csv"):
-    df = load_data(data_path)
+    return _available_years(data_path, os.path.getmtime(data_path))
+
+
+@functools.lru_cache(maxsize=4)
+def _available_years(data_path, mtime):
+    df = _load_data(data_path, mtime)
     years = sorted(df["year"].unique().tolist())
-    return [y for y in years if y != 0]
+    return tuple(y for y in years if y != 0)
 
 
 # ------------------------
@@ -64,57 +84,95 @@ def melt_education(df_year):
     available = [c for c in EDUCATION_COLS if c in df_year.columns]
     if not available:
         return pd.DataFrame(columns=["year", "Educational_Attainment", "Education_Count"])
-    return df_year.melt(
+    result = df_year.melt(
         id_vars="year",
         value_vars=available,
         var_name="Educational_Attainment",
         value_name="Education_Count"
     )
+    # categorical codes make downstream isin/groupby/pivot compare
+    # int codes instead of hashing Python strings per row
+    result["Educational_Attainment"] = result["Educational_Attainment"].astype(
+        pd.CategoricalDtype(categories=available))
+    return result
 
 
 def melt_occupation(df_year):
     available = [c for c in OCCUPATION_COLS if c in df_year.columns]
     if not available:
         return pd.DataFrame(columns=["year", "Occupation", "Occupation_Count"])
-    return df_year.melt(
+    result = df_year.melt(
         id_vars="year",
         value_vars=available,
         var_name="Occupation",
         value_name="Occupation_Count"
     )
+    result["Occupation"] = result["Occupation"].astype(
+        pd.CategoricalDtype(categories=available))
+    return result
 
 # ------------------------
 # Joint proportional distribution (Option C)
 # ------------------------
 
 
-def estimate_joint(educ_df, occ_df):
+def _joint_kernel_py(e, o):
+    """Proportions, outer product and scaling in NumPy."""
+    return np.multiply.outer(e / e.sum(), o / o.sum()) * 100.0
+
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; the NumPy kernel is the default
+    _joint_kernel = _joint_kernel_py
+else:
+    @njit(cache=True, fastmath=True)
+    def _joint_kernel(e, o):
+        # fused loop: no intermediate proportion arrays between the
+        # divisions and the outer product
+        se = e.sum()
+        so = o.sum()
+        out = np.empty((e.size, o.size))
+        for i in range(e.size):
+            ep = e[i] / se * 100.0
+            for j in range(o.size):
+                out[i, j] = ep * (o[j] / so)
+        return out
+
+
+def estimate_joint(educ_df, occ_df, return_matrix=False):
     # if either empty -> None
     if educ_df is None or occ_df is None or educ_df.empty or occ_df.empty:
         return None
 
-    total_educ = educ_df["Education_Count"].sum()
-    total_occ = occ_df["Occupation_Count"].sum()
+    e = educ_df["Education_Count"].to_numpy(dtype=np.float64)
+    o = occ_df["Occupation_Count"].to_numpy(dtype=np.float64)
+    total_educ = e.sum()
+    total_occ = o.sum()
     if total_educ == 0 or total_occ == 0:
         return None
 
-    # cross join (proportional estimate)
-    ed = educ_df.copy()
-    oc = occ_df.copy()
-    ed["key"] = 1
-    oc["key"] = 1
-    joint = ed.merge(oc, on=["year", "key"]).drop(columns=["key"])
-
-    joint["educ_prop"] = joint["Education_Count"] / total_educ
-    joint["occ_prop"] = joint["Occupation_Count"] / total_occ
-    joint["Percent"] = (joint["educ_prop"] * joint["occ_prop"]) * 100.0
-    joint["Percent"] = joint["Percent"].fillna(0.0)
-
-    joint = joint[[
-        "year", "Educational_Attainment", "Education_Count",
-        "Occupation", "Occupation_Count", "Percent"
-    ]]
-
+    # proportional estimate as an outer product of the two proportion
+    # vectors; no cross-join DataFrame needed
+    pct = np.nan_to_num(_joint_kernel(e, o))
+
+    joint = pd.DataFrame({
+        "year": np.repeat(educ_df["year"].to_numpy(), o.size),
+        "Educational_Attainment": np.repeat(
+            educ_df["Educational_Attainment"].to_numpy(), o.size),
+        "Education_Count": np.repeat(e, o.size),
+        "Occupation": np.tile(occ_df["Occupation"].to_numpy(), e.size),
+        "Occupation_Count": np.tile(o, e.size),
+        "Percent": pct.ravel(),
+    })
+
+    if return_matrix:
+        # 2-D view for heatmap rendering; skips the pivot_table reshape
+        matrix = pd.DataFrame(
+            pct, index=educ_df["Educational_Attainment"].to_numpy(),
+            columns=occ_df["Occupation"].to_numpy())
+        return joint, matrix
     return joint
 
 # ------------------------
@@ -122,47 +180,69 @@ def estimate_joint(educ_df, occ_df):
 # ------------------------
 
 
-def build_heatmap(joint_df, title, x_order=None, y_order=None):
-    if joint_df is None or joint_df.empty:
-        return None
-
-    # x categories (occupations) - alphabetical or provided order
-    if x_order is None:
-        x_cats = sorted(joint_df["Occupation"].unique())
-    else:
-        x_cats = [x for x in x_order if x in joint_df["Occupation"].unique()]
-
-    # y categories (education) - preserve provided order or reverse alphabetical
-    if y_order is None:
-        y_cats = sorted(
-            joint_df["Educational_Attainment"].unique(), reverse=True)
+def build_heatmap(joint_df, title, x_order=None, y_order=None, matrix=None):
+    # deferred: data-only callers skip the matplotlib import cost
+    import matplotlib.pyplot as plt
+    if matrix is not None:
+        # matrix from estimate_joint(return_matrix=True): reindex the
+        # rows/columns directly, no hash-based pivot_table reshape
+        if matrix.empty:
+            return None
+        if x_order is None:
+            x_cats = sorted(matrix.columns)
+        else:
+            x_cats = [x for x in x_order if x in matrix.columns]
+        if y_order is None:
+            y_cats = sorted(matrix.index, reverse=True)
+        else:
+            y_cats = [y for y in y_order if y in matrix.index]
+        pivot_data = matrix.reindex(index=y_cats, columns=x_cats)
     else:
-        y_cats = [
-            y for y in y_order if y in joint_df["Educational_Attainment"].unique()]
-
-    # Create pivot table for heatmap
-    pivot_data = joint_df.pivot_table(
-        index="Educational_Attainment",
-        columns="Occupation",
-        values="Percent",
-        aggfunc='first'
-    ).reindex(index=y_cats, columns=x_cats)
-
-    # Create figure
-    fig, ax = plt.subplots(
-        figsize=(max(12, len(x_cats) * 0.8), max(8, len(y_cats) * 0.6)))
-
-    # Create heatmap
-    sns.heatmap(
-        pivot_data,
-        annot=True,
-        fmt=".2f",
-        cmap="viridis_r",  # reversed viridis
-        center=None,
-        square=False,
-        ax=ax,
-        cbar_kws={'label': 'Percentage (%)', 'format': '%.1f%%'}
-    )
+        if joint_df is None or joint_df.empty:
+            return None
+
+        # x categories (occupations) - alphabetical or provided order
+        if x_order is None:
+            x_cats = sorted(joint_df["Occupation"].unique())
+        else:
+            x_cats = [x for x in x_order if x in joint_df["Occupation"].unique()]
+
+        # y categories (education) - preserve provided order or reverse alphabetical
+        if y_order is None:
+            y_cats = sorted(
+                joint_df["Educational_Attainment"].unique(), reverse=True)
+        else:
+            y_cats = [
+                y for y in y_order if y in joint_df["Educational_Attainment"].unique()]
+
+        # Create pivot table for heatmap
+        pivot_data = joint_df.pivot_table(
+            index="Educational_Attainment",
+            columns="Occupation",
+            values="Percent",
+            aggfunc='first'
+        ).reindex(index=y_cats, columns=x_cats)
+
+    # Create figure: reuse the registry slot for this panel across
+    # calls (clear=True) so repeated interactive renders do not pile up
+    # figures, axes and transforms in Matplotlib's registry
+    fig = plt.figure(num=f"heatmap:{title}", clear=True)
+    fig.set_size_inches(max(12, len(x_cats) * 0.8), max(8, len(y_cats) * 0.6))
+    ax = fig.add_subplot(111)
+
+    # Create heatmap: imshow + a precomputed text matrix instead of
+    # seaborn's per-cell formatting path
+    mat = pivot_data.to_numpy(dtype=float)
+    im = ax.imshow(mat, cmap="viridis_r", aspect="auto")
+    fig.colorbar(im, ax=ax, label='Percentage (%)', format='%.1f%%')
+    ax.set_xticks(np.arange(len(x_cats)), labels=x_cats)
+    ax.set_yticks(np.arange(len(y_cats)), labels=y_cats)
+
+    texts = np.char.mod("%.2f", mat)
+    threshold = (np.nanmax(mat) + np.nanmin(mat)) / 2.0
+    for (i, j), t in np.ndenumerate(texts):
+        ax.text(j, i, t, ha="center", va="center",
+                color="white" if mat[i, j] > threshold else "black")
 
     # Customize appearance
     ax.set_title(title, fontsize=16, pad=20)
@@ -182,39 +262,96 @@ def build_heatmap(joint_df, title, x_order=None, y_order=None):
 # ------------------------
 
 
-def get_heatmaps(year, data_path="data/merged_data.csv"):
-    df = load_data(data_path)
-    df_year = df[df["year"] == int(year)]
-    if df_year.empty:
-        return None, None, None, None
-
-    educ_df = melt_education(df_year)
-    occ_df = melt_occupation(df_year)
-    if educ_df.empty or occ_df.empty:
-        return None, None, None, None
-
-    # totals to rank educational attainment
-    educ_totals = educ_df.groupby("Educational_Attainment", as_index=False)[
-        "Education_Count"].sum()
-    educ_totals = educ_totals.sort_values("Education_Count", ascending=False)
-
-    top10_educ = educ_totals.head(10)["Educational_Attainment"].tolist()
-    bottom10_educ = educ_totals.tail(10)["Educational_Attainment"].tolist()
-
-    educ_top_df = educ_df[educ_df["Educational_Attainment"].isin(
-        top10_educ)].reset_index(drop=True)
-    educ_bottom_df = educ_df[educ_df["Educational_Attainment"].isin(
-        bottom10_educ)].reset_index(drop=True)
+@functools.lru_cache(maxsize=4)
+def _year_index(path, mtime):
+    """Per-year education/occupation totals, aggregated once per file.
+
+    Returns ({year: (educ_vec, occ_vec)}, educ_cols, occ_cols) so each
+    get_heatmaps call is an O(1) dict lookup plus O(E+O) math instead
+    of a fresh filter/melt/groupby pass over the whole frame.
+    """
+    df = _load_data(path, mtime)
+    educ_cols = [c for c in EDUCATION_COLS if c in df.columns]
+    occ_cols = [c for c in OCCUPATION_COLS if c in df.columns]
+    educ_sums = df.groupby("year")[educ_cols].sum()
+    occ_sums = df.groupby("year")[occ_cols].sum()
+    index = {
+        int(y): (educ_sums.loc[y].to_numpy(dtype=np.float64),
+                 occ_sums.loc[y].to_numpy(dtype=np.float64))
+        for y in educ_sums.index
+    }
+    return index, tuple(educ_cols), tuple(occ_cols)
+
+
+def year_total(year, data_path="data/merged_data.csv"):
+    """Total emigrant count for a year, from the cached aggregates.
+
+    The education columns are a full partition of emigrants, so their
+    sum alone is the emigrant count. Summing several partitions (or
+    every numeric column of the merged frame) counts each person once
+    per partition and inflates the total.
+    """
+    index, _, _ = _year_index(data_path, os.path.getmtime(data_path))
+    entry = index.get(int(year))
+    if entry is None:
+        return 0
+    educ_vec, _ = entry
+    return int(educ_vec.sum())
 
-    occ_alphabetical = sorted(occ_df["Occupation"].unique().tolist())
 
-    top_joint = estimate_joint(educ_top_df, occ_df)
-    bottom_joint = estimate_joint(educ_bottom_df, occ_df)
+def get_heatmaps(year, data_path="data/merged_data.csv"):
+    index, educ_cols, occ_cols = _year_index(
+        data_path, os.path.getmtime(data_path))
+    entry = index.get(int(year))
+    if entry is None or not educ_cols or not occ_cols:
+        return None, None, None, None
+    totals, occ_vec = entry
+
+    # totals rank educational attainment; argpartition picks the
+    # top/bottom-10 without a full sort, then a 10-element argsort
+    # restores the descending-by-count label order
+    names = np.array(educ_cols)
+    if totals.size > 10:
+        top_idx = np.argpartition(-totals, 10)[:10]
+        bottom_idx = np.argpartition(totals, 10)[:10]
+    else:
+        top_idx = bottom_idx = np.arange(totals.size)
+    top_idx = top_idx[np.argsort(-totals[top_idx])]
+    bottom_idx = bottom_idx[np.argsort(-totals[bottom_idx])]
+    top10_educ = names[top_idx].tolist()
+    bottom10_educ = names[bottom_idx].tolist()
+
+    # tidy frames built straight from the precomputed vectors
+    occ_df = pd.DataFrame({
+        "year": int(year), "Occupation": list(occ_cols),
+        "Occupation_Count": occ_vec})
+    educ_top_df = pd.DataFrame({
+        "year": int(year), "Educational_Attainment": top10_educ,
+        "Education_Count": totals[top_idx]})
+    educ_bottom_df = pd.DataFrame({
+        "year": int(year), "Educational_Attainment": bottom10_educ,
+        "Education_Count": totals[bottom_idx]})
+
+    occ_alphabetical = sorted(occ_cols)
+
+    # the two estimates are independent; the NumPy work releases the
+    # GIL, so overlap them in a small pool
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_top = ex.submit(
+            estimate_joint, educ_top_df, occ_df, return_matrix=True)
+        f_bottom = ex.submit(
+            estimate_joint, educ_bottom_df, occ_df, return_matrix=True)
+        top = f_top.result()
+        bottom = f_bottom.result()
+    top_joint, top_matrix = top if top is not None else (None, None)
+    bottom_joint, bottom_matrix = bottom if bottom is not None else (None, None)
 
     top_plot = build_heatmap(top_joint, "Top 10 Educational Attainment × Occupations (Proportional %)",
-                             x_order=occ_alphabetical, y_order=top10_educ)
+                             x_order=occ_alphabetical, y_order=top10_educ,
+                             matrix=top_matrix)
     bottom_plot = build_heatmap(bottom_joint, "Bottom 10 Educational Attainment × Occupations (Proportional %)",
-                                x_order=occ_alphabetical, y_order=bottom10_educ)
+                                x_order=occ_alphabetical, y_order=bottom10_educ,
+                                matrix=bottom_matrix)
 
     # Return (top_plot, bottom_plot, top_joint, bottom_joint)
     return top_plot, bottom_plot, top_joint, bottom_joint
@@ -227,9 +364,11 @@ def get_heatmaps(year, data_path="data/merged_data.csv"):
 def extract_insight(joint_df):
     if joint_df is None or joint_df.empty:
         return None, None, None
-    idx = joint_df["Percent"].idxmax()
-    row = joint_df.loc[idx]
-    return row["Educational_Attainment"], row["Occupation"], float(row["Percent"])
+    # scalar argmax/iat path: no label lookup, no intermediate Series
+    pct = joint_df["Percent"].to_numpy()
+    i = int(pct.argmax())
+    return (joint_df["Educational_Attainment"].iat[i],
+            joint_df["Occupation"].iat[i], float(pct[i]))
 
 # ------------------------
 # Display helper
@@ -238,6 +377,8 @@ def extract_insight(joint_df):
 
 def show_heatmaps(year, data_path="data/merged_data.csv"):
     """Convenience function to display both heatmaps for a given year"""
+    # deferred: data-only callers skip the matplotlib import cost
+    import matplotlib.pyplot as plt
     top_plot, bottom_plot, top_joint, bottom_joint = get_heatmaps(
         year, data_path)
 
@@ -256,8 +397,26 @@ def show_heatmaps(year, data_path="data/merged_data.csv"):
 # ------------------------
 
 
+def save_heatmaps_for_years(years, save_dir=".", data_path="data/merged_data.csv"):
+    """Save heatmaps for a batch of years in one process.
+
+    The CSV parse and per-year aggregates are memoized (_load_data /
+    _year_index), so the whole batch shares one load and one groupby
+    pass; each iteration is just the outer-product math and rendering.
+    """
+    if not years:
+        years = available_years(data_path)
+    results = {}
+    for year in years:
+        results[int(year)] = save_heatmaps(
+            year, save_dir=save_dir, data_path=data_path)
+    return results
+
+
 def save_heatmaps(year, save_dir=".", data_path="data/merged_data.csv"):
     """Save both heatmaps as PNG files"""
+    # deferred: data-only callers skip the matplotlib import cost
+    import matplotlib.pyplot as plt
     top_plot, bottom_plot, top_joint, bottom_joint = get_heatmaps(
         year, data_path)
 
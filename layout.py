@@ -0,0 +1,70 @@
+# layout.py
+import os
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from _static import MarkdownIt, PAGE_CFG, get_static_html, render_md
+
+HOME_PARTIAL_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".streamlit", "static", "home.html")
+
+
+@st.cache_resource
+def load_home_partial():
+    """Read the prerendered home partial (built by build_home.py) once."""
+    if os.path.exists(HOME_PARTIAL_PATH):
+        with open(HOME_PARTIAL_PATH, encoding="utf-8") as f:
+            return f.read()
+    return None
+
+
+def render_home():
+    """Render the shared home page layout (used by Home.py)."""
+    # Page configuration
+    st.set_page_config(**PAGE_CFG)
+
+    # Prerendered static partial: skips markdown parsing and element
+    # diffing entirely when the built HTML is available
+    partial = load_home_partial()
+    if partial is not None:
+        st.sidebar.markdown(
+            get_static_html()["sidebar"], unsafe_allow_html=True)
+        st.title('🇵🇭 Filipino Migrators Dashboard')
+        components.html(partial, height=700, scrolling=True)
+        return
+
+    # Fallback: dynamic rendering when the partial has not been built
+    # Static scaffolding is built once per session and reused across reruns
+    static_html = get_static_html()
+
+    # Emit the stylesheet link every run: Streamlit culls elements that
+    # are not re-emitted, so a once-per-session guard would drop the
+    # CSS on the next rerun. The link is one tiny element and the
+    # browser caches the stylesheet itself.
+    st.markdown(static_html["css"], unsafe_allow_html=True)
+
+    # Sidebar navigation
+    st.sidebar.markdown(static_html["sidebar"], unsafe_allow_html=True)
+
+    # Main content (native element: no client-side HTML parse per rerun)
+    st.title('🇵🇭 Filipino Migrators Dashboard')
+
+    # Introduction section
+    st.markdown(static_html["intro"], unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Welcome message: collapsed expander so the markdown body is not
+    # rendered until the user opens it
+    with st.expander("About This Dashboard", expanded=False):
+        if MarkdownIt is not None:
+            # Markdown parsed to HTML once per session instead of on
+            # every rerun by the frontend markdown component
+            st.html(render_md(static_html["about"]))
+        else:
+            st.markdown(static_html["about"])
+
+    # Footer
+    st.markdown("---")
+    st.caption("Data Source: Filipino Migration Statistics | Last Updated: 2022")
@@ -1,7 +0,0 @@
-# Page configuration
-import streamlit as st
-
-
-st.text('Belee Part')
-st.header("My header")
-st.subheader("My subheader")
\ No newline at end of file
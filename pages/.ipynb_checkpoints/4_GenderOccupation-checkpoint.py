@@ -1,4 +0,0 @@
-import streamlit as st
-
-# Page configuration
-st.text('Aaron Part')
\ No newline at end of file
@@ -1,3 +1,6 @@
+import os
+from functools import cached_property
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
@@ -14,6 +17,49 @@ st.set_page_config(
 
 # Dark mode custom CSS
 
+# Colorscale options frozen at import; the dict gives O(1) index
+# lookups for the selectbox instead of a linear list.index scan
+_COLORSCALES = ("Viridis", "Plasma", "Turbo", "Blues",
+                "Reds", "Greens", "YlOrRd", "RdYlBu")
+_CS_IDX = {v: i for i, v in enumerate(_COLORSCALES)}
+
+# Sidebar HTML blobs built once at import instead of re-concatenated
+# (and re-sanitized) on every rerun
+_SIDEBAR_BANNER_HTML = """
+    <div style='text-align: center; padding: 1.5rem 0.5rem; background: linear-gradient(135deg, #1e3a8a 0%, #3b82f6 100%); border-radius: 12px; margin-bottom: 1.5rem;'>
+        <h2 style='color: white; margin: 0; font-size: 1.5rem; text-shadow: 0 2px 4px rgba(0,0,0,0.3);'>🎛️ CONTROL PANEL</h2>
+        <p style='color: #dbeafe; margin: 0.5rem 0 0 0; font-size: 0.85rem;'>Customize your analysis</p>
+    </div>
+"""
+
+_SECTION_HTML_TPL = """
+    <div style='background: rgba(59, 130, 246, 0.1); border: 1px solid #3b82f6; border-radius: 8px; padding: 0.8rem; margin-bottom: 1rem;'>
+        <p style='color: #60a5fa; margin: 0; font-weight: 600; font-size: 0.9rem;'>{}</p>
+    </div>
+"""
+
+_SECTION_TIME_HTML = _SECTION_HTML_TPL.format("📅 TIME PERIOD")
+_SECTION_FILTERS_HTML = _SECTION_HTML_TPL.format("🔍 DATA FILTERS")
+_SECTION_VIZ_HTML = _SECTION_HTML_TPL.format("🎨 VISUALIZATION")
+
+# One precompiled card template shared by all five metric cards
+_METRIC_CARD = (
+    "<div style='text-align: center; padding: 1rem;'>"
+    "<p style='color: #94a3b8; font-size: 0.9rem; margin: 0; text-transform: uppercase;'>{label}</p>"
+    "<p style='color: {color}; font-size: {size}; font-weight: 700; margin: 0.5rem 0;'>{value}</p>"
+    "{extra}"
+    "</div>"
+)
+
+_FILTER_BANNER_TPL = """
+    <div style='background: rgba(251, 191, 36, 0.1); border: 1px solid #fbbf24; border-radius: 8px; padding: 0.8rem; margin-bottom: 1rem;'>
+        <p style='margin: 0; color: #fbbf24; font-size: 0.9rem;'>
+            <strong>🔍 Active Filters:</strong> {}
+            <span style='color: #94a3b8;'>(Showing filtered data only)</span>
+        </p>
+    </div>
+"""
+
 
 class DataLoader:
     """Class to handle data loading and caching"""
@@ -22,14 +68,37 @@ class DataLoader:
     @st.cache_data
     def load_all_data():
         """Load all datasets with error handling"""
+        def read_pivot(csv_path):
+            # Prefer the Parquet copy (written by convert.py): columnar
+            # and pre-typed, so no CSV parsing or dtype inference
+            parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+            if os.path.exists(parquet_path):
+                return pd.read_parquet(parquet_path)
+            return pd.read_csv(csv_path)
+
         try:
-            educ_pivot = pd.read_csv('./data/educ_pivot.csv')
-            age_pivot = pd.read_csv('./data/age_pivot.csv')
-            occu_pivot = pd.read_csv('./data/occu_pivot.csv')
-            countries_pivot = pd.read_csv('./data/countries_pivot.csv')
-            sex_pivot = pd.read_csv('./data/sex_pivot.csv')
-            civ_pivot = pd.read_csv('./data/civ_pivot.csv')
-            origin_regions_pivot = pd.read_csv('./data/regions_pivot.csv')
+            educ_pivot = read_pivot('./data/educ_pivot.csv')
+            age_pivot = read_pivot('./data/age_pivot.csv')
+            occu_pivot = read_pivot('./data/occu_pivot.csv')
+            countries_pivot = read_pivot('./data/countries_pivot.csv')
+            sex_pivot = read_pivot('./data/sex_pivot.csv')
+            civ_pivot = read_pivot('./data/civ_pivot.csv')
+            origin_regions_pivot = read_pivot('./data/regions_pivot.csv')
+
+            # Index every pivot by year once at load time so per-year
+            # lookups are O(1) .loc hits instead of boolean-mask scans
+            # on every rerun
+            for pivot in (educ_pivot, age_pivot, occu_pivot, countries_pivot,
+                          sex_pivot, civ_pivot, origin_regions_pivot):
+                pivot.set_index('year', inplace=True)
+
+            # Precomputed row totals: the per-year grand total becomes
+            # an O(1) column read instead of a wide reduction on every
+            # call. The age pivot is skipped because it carries age
+            # brackets outside the dashboard's filter options, so its
+            # row sum is not the total the filters use.
+            for pivot in (educ_pivot, occu_pivot, countries_pivot):
+                pivot['__total__'] = pivot.sum(axis=1).astype(np.int64)
 
             return {
                 'education': educ_pivot,
@@ -136,36 +205,51 @@ class DataProcessor:
         self.all_education_options = list(self.education_mapping.keys())
         self.all_occupation_options = list(self.occupation_mapping.keys())
 
-    def get_year_data(self, pivot_df, year):
-        """Get data for specific year"""
-        result = pivot_df[pivot_df['year'] == year]
-        return result.iloc[0] if not result.empty else None
+        # Mapping dicts materialized as Series once so renderers can
+        # translate code columns with a vectorized .map lookup
+        self.country_name_map = pd.Series(self.country_mapping)
+        self.region_name_map = pd.Series(self.region_mapping)
 
-    def get_country_columns(self):
-        """Get list of country columns"""
-        return [col for col in self.data['countries'].columns if col != 'year']
+        # Category labels resolved to pivot column names once, so the
+        # unfiltered-total path skips mapping resolution on every call
+        self._edu_cols_all = [self.education_mapping[k]
+                              for k in self.all_education_options]
+        self._age_cols_all = list(self.all_age_options)
+        self._occ_cols_all = [self.occupation_mapping[k]
+                              for k in self.all_occupation_options]
 
-    def get_region_columns(self):
-        """Get list of region columns"""
+    def get_year_data(self, pivot_df, year):
+        """Get data for specific year"""
+        return pivot_df.loc[year] if year in pivot_df.index else None
+
+    @cached_property
+    def years(self):
+        """Sorted list of available years, computed once per processor"""
+        return sorted(self.data['education'].index.unique())
+
+    @cached_property
+    def country_columns(self):
+        """List of country columns, computed once per processor"""
+        return [col for col in self.data['countries'].columns
+                if col not in ('year', '__total__')]
+
+    @cached_property
+    def region_columns(self):
+        """List of region columns, computed once per processor"""
         return [col for col in self.data['origin_regions'].columns if col != 'year']
 
-    def calculate_filtered_total(self, year_data, filter_categories, category_mapping, filter_list):
+    def calculate_filtered_total(self, year_data, all_columns, category_mapping, filter_list):
         """Calculate total for filtered categories"""
-        if not filter_list:  # If no filter, return sum of all categories
-            total = 0
-            for category in filter_categories:
-                col_name = category_mapping.get(category, category)
-                if col_name in year_data:
-                    total += year_data[col_name]
-            return total
-
-        # If filter applied, only sum selected categories
-        total = 0
-        for category in filter_list:
-            col_name = category_mapping.get(category, category)
-            if col_name in year_data:
-                total += year_data[col_name]
-        return total
+        # Only the filtered path needs label-to-column resolution; the
+        # common no-filter path reads the precomputed row total when
+        # the pivot carries one, else reuses the precomputed columns
+        if filter_list:
+            cols = [category_mapping.get(c, c) for c in filter_list]
+        elif '__total__' in year_data:
+            return float(year_data['__total__'])
+        else:
+            cols = all_columns
+        return float(year_data.reindex(cols, fill_value=0).sum())
 
 
 class FilterManager:
@@ -209,21 +293,12 @@ class FilterManager:
 
     def render_sidebar_controls(self):
         """Render sidebar filter controls"""
-        st.sidebar.markdown("""
-            <div style='text-align: center; padding: 1.5rem 0.5rem; background: linear-gradient(135deg, #1e3a8a 0%, #3b82f6 100%); border-radius: 12px; margin-bottom: 1.5rem;'>
-                <h2 style='color: white; margin: 0; font-size: 1.5rem; text-shadow: 0 2px 4px rgba(0,0,0,0.3);'>🎛️ CONTROL PANEL</h2>
-                <p style='color: #dbeafe; margin: 0.5rem 0 0 0; font-size: 0.85rem;'>Customize your analysis</p>
-            </div>
-        """, unsafe_allow_html=True)
+        st.sidebar.markdown(_SIDEBAR_BANNER_HTML, unsafe_allow_html=True)
 
         # Year Selection
-        st.sidebar.markdown("""
-            <div style='background: rgba(59, 130, 246, 0.1); border: 1px solid #3b82f6; border-radius: 8px; padding: 0.8rem; margin-bottom: 1rem;'>
-                <p style='color: #60a5fa; margin: 0; font-weight: 600; font-size: 0.9rem;'>📅 TIME PERIOD</p>
-            </div>
-        """, unsafe_allow_html=True)
+        st.sidebar.markdown(_SECTION_TIME_HTML, unsafe_allow_html=True)
 
-        years = sorted(self.processor.data['education']['year'].unique())
+        years = self.processor.years
         selected_year = st.sidebar.selectbox(
             "Select Year",
             years,
@@ -238,11 +313,7 @@ class FilterManager:
                 "Compare with", [y for y in years if y != selected_year])
 
         # Data Filters
-        st.sidebar.markdown("""
-            <div style='background: rgba(59, 130, 246, 0.1); border: 1px solid #3b82f6; border-radius: 8px; padding: 0.8rem; margin: 1rem 0;'>
-                <p style='color: #60a5fa; margin: 0; font-weight: 600; font-size: 0.9rem;'>🔍 DATA FILTERS</p>
-            </div>
-        """, unsafe_allow_html=True)
+        st.sidebar.markdown(_SECTION_FILTERS_HTML, unsafe_allow_html=True)
 
         # Education filter
         education_filter = st.sidebar.multiselect(
@@ -281,31 +352,27 @@ class FilterManager:
         )
 
         # Update session state when button is clicked
+        # The button click already triggers a rerun and the sidebar
+        # runs before the dashboard body, so the updated filters are
+        # picked up in this same pass — no second full rerun needed
         if st.sidebar.button("Apply Filters", use_container_width=True, help="Apply selected filters to dashboard"):
             st.session_state.education_filter = education_filter
             st.session_state.age_filter = age_filter
             st.session_state.occupation_filter = occupation_filter
-            st.rerun()
 
         # Visualization Options
-        st.sidebar.markdown("""
-            <div style='background: rgba(59, 130, 246, 0.1); border: 1px solid #3b82f6; border-radius: 8px; padding: 0.8rem; margin: 1rem 0;'>
-                <p style='color: #60a5fa; margin: 0; font-weight: 600; font-size: 0.9rem;'>🎨 VISUALIZATION</p>
-            </div>
-        """, unsafe_allow_html=True)
+        st.sidebar.markdown(_SECTION_VIZ_HTML, unsafe_allow_html=True)
 
         map_colorscale = st.sidebar.selectbox(
             "🗺️ Map Color Scheme",
-            ["Viridis", "Plasma", "Turbo", "Blues",
-                "Reds", "Greens", "YlOrRd", "RdYlBu"],
-            index=["Viridis", "Plasma", "Turbo", "Blues", "Reds", "Greens",
-                   "YlOrRd", "RdYlBu"].index(st.session_state.map_colorscale)
+            _COLORSCALES,
+            index=_CS_IDX.get(st.session_state.map_colorscale, 0)
         )
 
         # Top Countries Filter
         available_countries = sorted([
             self.processor.country_mapping[col]
-            for col in self.processor.get_country_columns()
+            for col in self.processor.country_columns
             if col in self.processor.country_mapping
         ])
 
@@ -348,65 +415,94 @@ class FilterManager:
         return selected_year, show_comparison, comparison_year
 
 
+# Shared dark layout defaults, built once at import
+_DARK_TEMPLATE = {
+    'paper_bgcolor': 'rgba(0,0,0,0)',
+    'plot_bgcolor': 'rgba(0,0,0,0)',
+    'font': {'color': '#e4e6eb'},
+    'xaxis': {'gridcolor': '#1e3a8a', 'color': '#94a3b8'},
+    'yaxis': {'gridcolor': '#1e3a8a', 'color': '#94a3b8'},
+}
+
+
+@st.cache_resource
+def _base_map_fig():
+    """Build the world-map figure scaffold once per process.
+
+    The geo styling, layout, and trace slots never change between
+    reruns. st.cache_resource shares this object across sessions, so
+    callers must copy it before mutating; create_world_map copies the
+    scaffold and swaps the per-year data arrays in, still skipping the
+    full px.choropleth figure construction.
+    """
+    fig = go.Figure([
+        go.Choropleth(
+            locationmode='country names',
+            colorbar=dict(
+                title=dict(text="Migrants", font=dict(color='#e4e6eb')),
+                tickfont=dict(color='#e4e6eb')
+            )
+        ),
+        # Text labels layered on top of the choropleth
+        go.Scattergeo(
+            locationmode='country names',
+            mode='text',
+            textfont=dict(color='white', size=10),
+            showlegend=False,
+            hoverinfo='none'
+        )
+    ])
+    fig.update_geos(
+        showcoastlines=True,
+        coastlinecolor='#334155',
+        showland=True,
+        landcolor='#1e293b',
+        showcountries=True,
+        countrycolor='#334155',
+        bgcolor='rgba(0,0,0,0)',
+        showframe=False,
+        projection_type='natural earth'
+    )
+    fig.update_layout(
+        **_DARK_TEMPLATE,
+        height=600,
+        margin=dict(l=0, r=0, t=0, b=0)
+    )
+    return fig
+
+
 class VisualizationEngine:
     """Class to handle all visualizations"""
 
     def __init__(self):
-        self.dark_template = {
-            'paper_bgcolor': 'rgba(0,0,0,0)',
-            'plot_bgcolor': 'rgba(0,0,0,0)',
-            'font': {'color': '#e4e6eb'},
-            'xaxis': {'gridcolor': '#1e3a8a', 'color': '#94a3b8'},
-            'yaxis': {'gridcolor': '#1e3a8a', 'color': '#94a3b8'},
-        }
+        self.dark_template = _DARK_TEMPLATE
 
     def create_world_map(self, map_df, selected_year, total_migrants, colorscale="Viridis"):
         """Create world map visualization"""
-        fig_map = px.choropleth(
-            map_df,
-            locations='country',
-            locationmode='country names',
-            color='migrants',
-            hover_name='country',
-            hover_data={'country': False},
-            custom_data=['migrants', 'percentage'],
-            color_continuous_scale=colorscale,
-            height=600,
-            labels={'migrants': 'Number of Migrants'}
-        )
+        # Copy the shared scaffold so concurrent sessions never mutate
+        # (and serialize) the same figure object
+        fig_map = go.Figure(_base_map_fig())
+
+        # Single contiguous fp32 block: halves the hover-payload bytes
+        # and lets Plotly serialize it as one typed array
+        customdata = np.empty((len(map_df), 2), dtype=np.float32)
+        customdata[:, 0] = map_df['migrants'].to_numpy()
+        customdata[:, 1] = map_df['percentage'].to_numpy()
 
         # Enhanced hover with simple HTML (markdown-like styling)
-        fig_map.update_traces(
+        fig_map.data[0].update(
+            locations=map_df['country'].to_numpy(),
+            z=map_df['migrants'].to_numpy(dtype=np.float32),
+            customdata=customdata,
+            colorscale=colorscale,
+            hovertext=map_df['country'].to_numpy(),
             hovertemplate=(
                 "<b style='font-size:14px;'>%{hovertext}</b><br><br>"
                 "<span style='color:#94a3b8;'>Total Migrants:</span> <span style='color:#00d4ff;font-weight:bold;'>%{customdata[0]:,.0f}</span><br>"
                 "<span style='color:#94a3b8;'>Share of Total:</span> <span style='color:#4ade80;font-weight:bold;'>%{customdata[1]:.2f}%</span><br>"
                 "<span style='color:#94a3b8;'>Year:</span> <span style='color:#fbbf24;font-weight:bold;'>" +
-                
-                
                 str(selected_year) + "</span><br>"
                 "<extra></extra>"
-            ),
-            selector=dict(type='choropleth')
-        )
-        fig_map.update_geos(
-            showcoastlines=True,
-            coastlinecolor='#334155',
-            showland=True,
-            landcolor='#1e293b',
-            showcountries=True,
-            countrycolor='#334155',
-            bgcolor='rgba(0,0,0,0)',
-            showframe=False,
-            projection_type='natural earth'
-        )
-
-        fig_map.update_layout(
-            **self.dark_template,
-            margin=dict(l=0, r=0, t=0, b=0),
-            coloraxis_colorbar=dict(
-                title=dict(text="Migrants", font=dict(color='#e4e6eb')),
-                tickfont=dict(color='#e4e6eb')
             )
         )
 
@@ -416,8 +512,8 @@ class VisualizationEngine:
         """Create migration trend chart"""
         fig_trend = go.Figure()
         fig_trend.add_trace(go.Scatter(
-            x=trend_df['Year'],
-            y=trend_df['Total'],
+            x=trend_df['Year'].to_numpy(),
+            y=trend_df['Total'].to_numpy(dtype=np.float32),
             mode='lines+markers',
             fill='tozeroy',
             line=dict(color='#00d4ff', width=3),
@@ -440,28 +536,23 @@ class VisualizationEngine:
 
     def create_bar_chart(self, data_df, x, y, title, color_col=None, orientation='v', color_scale='Viridis', height=400):
         """Create a bar chart with dark theme"""
-        if orientation == 'h':
-            fig = px.bar(
-                data_df,
-                x=x,
-                y=y,
-                orientation='h',
-                title=f'<b>{title}</b>',
-                color=color_col,
-                color_continuous_scale=color_scale
-            )
-        else:
-            fig = px.bar(
-                data_df,
-                x=x,
-                y=y,
-                title=f'<b>{title}</b>',
-                color=color_col,
-                color_continuous_scale=color_scale
-            )
+        # go.Bar skips the px DataFrame-inference pass; arrays are
+        # extracted once as NumPy
+        marker = dict(
+            color=data_df[color_col].to_numpy(),
+            colorscale=color_scale
+        ) if color_col else None
+
+        fig = go.Figure(go.Bar(
+            x=data_df[x].to_numpy(),
+            y=data_df[y].to_numpy(),
+            orientation=orientation,
+            marker=marker
+        ))
 
         fig.update_layout(
             **self.dark_template,
+            title=f'<b>{title}</b>',
             height=height,
             showlegend=False
         )
@@ -470,17 +561,18 @@ class VisualizationEngine:
 
     def create_stacked_bar_chart(self, data_df, x, y, color, title, height=400):
         """Create a stacked bar chart"""
-        fig = px.bar(
-            data_df,
-            x=x,
-            y=y,
-            color=color,
-            title=f'<b>{title}</b>',
-            barmode='stack'
-        )
+        fig = go.Figure()
+        for name, group in data_df.groupby(color, sort=False):
+            fig.add_trace(go.Bar(
+                x=group[x].to_numpy(),
+                y=group[y].to_numpy(),
+                name=str(name)
+            ))
 
         fig.update_layout(
             **self.dark_template,
+            barmode='stack',
+            title=f'<b>{title}</b>',
             height=height
         )
 
@@ -488,23 +580,105 @@ class VisualizationEngine:
 
     def create_heatmap(self, data_df, x, y, z, title, height=500):
         """Create a heatmap"""
-        fig = px.density_heatmap(
-            data_df,
-            x=x,
-            y=y,
-            z=z,
-            title=f'<b>{title}</b>',
-            color_continuous_scale='Viridis'
-        )
+        fig = go.Figure(go.Heatmap(
+            x=data_df[x].to_numpy(),
+            y=data_df[y].to_numpy(),
+            z=data_df[z].to_numpy(),
+            colorscale='Viridis'
+        ))
 
         fig.update_layout(
             **self.dark_template,
+            title=f'<b>{title}</b>',
             height=height
         )
 
         return fig
 
 
+@st.cache_data(show_spinner=False)
+def _compute_filtered(_processor, year, education, age, occupation):
+    """Compute year slices and filtered totals, memoized across reruns.
+
+    Keyed on (year, filter tuples); the processor is excluded from the
+    cache key (leading underscore) since its data is itself cached.
+    """
+    data = _processor.data
+
+    # Get year data
+    year_countries = _processor.get_year_data(data['countries'], year)
+    year_regions = _processor.get_year_data(data['origin_regions'], year)
+    year_educ = _processor.get_year_data(data['education'], year)
+    year_gender = _processor.get_year_data(data['gender'], year)
+    year_age = _processor.get_year_data(data['age'], year)
+    year_occu = _processor.get_year_data(data['occupation'], year)
+    year_civ = _processor.get_year_data(data['civil_status'], year)
+
+    # Calculate filtered totals
+    filtered_education_total = _processor.calculate_filtered_total(
+        year_educ, _processor._edu_cols_all,
+        _processor.education_mapping, list(education)
+    ) if year_educ is not None else 0
+
+    filtered_age_total = _processor.calculate_filtered_total(
+        year_age, _processor._age_cols_all, {}, list(age)
+    ) if year_age is not None else 0
+
+    filtered_occupation_total = _processor.calculate_filtered_total(
+        year_occu, _processor._occ_cols_all,
+        _processor.occupation_mapping, list(occupation)
+    ) if year_occu is not None else 0
+
+    # Unfiltered grand total, computed once and shared by every
+    # renderer instead of re-summing the country row per section
+    original_total = float(
+        year_countries['__total__']) if year_countries is not None else 0.0
+
+    # Top destination computed here so the idxmax scan runs once per
+    # (year, filters) under the cache instead of on every rerun
+    top_code = year_countries[_processor.country_columns].idxmax(
+    ) if year_countries is not None else None
+
+    # Calculate overall filtered total
+    if education or age or occupation:
+        filtered_totals = []
+        if education:
+            filtered_totals.append(filtered_education_total)
+        if age:
+            filtered_totals.append(filtered_age_total)
+        if occupation:
+            filtered_totals.append(filtered_occupation_total)
+
+        if filtered_totals:
+            total_migrants = min(filtered_totals)
+        else:
+            total_migrants = original_total
+    else:
+        total_migrants = original_total
+
+    return {
+        'year_data': {
+            'countries': year_countries,
+            'regions': year_regions,
+            'education': year_educ,
+            'gender': year_gender,
+            'age': year_age,
+            'occupation': year_occu,
+            'civil_status': year_civ
+        },
+        'totals': {
+            'migrants': total_migrants,
+            'education': filtered_education_total,
+            'age': filtered_age_total,
+            'occupation': filtered_occupation_total,
+            'original_total': original_total,
+            'filter_ratio': total_migrants / original_total if original_total else 0.0
+        },
+        'top_destination': _processor.country_mapping.get(top_code, 'N/A')
+        if top_code is not None else 'N/A'
+    }
+
+
 class Dashboard:
     """Main dashboard class"""
 
@@ -517,75 +691,17 @@ class Dashboard:
 
     def calculate_filtered_data(self, selected_year, filters):
         """Calculate all filtered data based on current filters"""
-        # Get year data
-        year_countries = self.processor.get_year_data(
-            self.data['countries'], selected_year)
-        year_regions = self.processor.get_year_data(
-            self.data['origin_regions'], selected_year)
-        year_educ = self.processor.get_year_data(
-            self.data['education'], selected_year)
-        year_gender = self.processor.get_year_data(
-            self.data['gender'], selected_year)
-        year_age = self.processor.get_year_data(
-            self.data['age'], selected_year)
-        year_occu = self.processor.get_year_data(
-            self.data['occupation'], selected_year)
-        year_civ = self.processor.get_year_data(
-            self.data['civil_status'], selected_year)
-
-        # Calculate filtered totals
-        filtered_education_total = self.processor.calculate_filtered_total(
-            year_educ, self.processor.all_education_options, self.processor.education_mapping, filters[
-                'education']
-        ) if year_educ is not None else 0
-
-        filtered_age_total = self.processor.calculate_filtered_total(
-            year_age, self.processor.all_age_options, {}, filters['age']
-        ) if year_age is not None else 0
-
-        filtered_occupation_total = self.processor.calculate_filtered_total(
-            year_occu, self.processor.all_occupation_options, self.processor.occupation_mapping, filters[
-                'occupation']
-        ) if year_occu is not None else 0
-
-        # Calculate overall filtered total
-        if filters['education'] or filters['age'] or filters['occupation']:
-            filtered_totals = []
-            if filters['education']:
-                filtered_totals.append(filtered_education_total)
-            if filters['age']:
-                filtered_totals.append(filtered_age_total)
-            if filters['occupation']:
-                filtered_totals.append(filtered_occupation_total)
-
-            if filtered_totals:
-                total_migrants = min(filtered_totals)
-            else:
-                total_migrants = year_countries[self.processor.get_country_columns()].sum(
-                ) if year_countries is not None else 0
-        else:
-            total_migrants = year_countries[self.processor.get_country_columns()].sum(
-            ) if year_countries is not None else 0
-
-        return {
-            'year_data': {
-                'countries': year_countries,
-                'regions': year_regions,
-                'education': year_educ,
-                'gender': year_gender,
-                'age': year_age,
-                'occupation': year_occu,
-                'civil_status': year_civ
-            },
-            'totals': {
-                'migrants': total_migrants,
-                'education': filtered_education_total,
-                'age': filtered_age_total,
-                'occupation': filtered_occupation_total
-            }
-        }
+        # Lists come from session state; convert to sorted tuples so
+        # st.cache_data can hash the call and reuse prior results
+        return _compute_filtered(
+            self.processor,
+            selected_year,
+            tuple(sorted(filters['education'])),
+            tuple(sorted(filters['age'])),
+            tuple(sorted(filters['occupation']))
+        )
 
-    def render_metrics(self, filtered_data, selected_year, show_comparison, comparison_year):
+    def render_metrics(self, filtered_data, selected_year, delta_total=None):
         """Render key metrics row"""
         totals = filtered_data['totals']
         year_data = filtered_data['year_data']
@@ -602,10 +718,8 @@ class Dashboard:
 
         # Apply filter ratio
         if any([st.session_state.education_filter, st.session_state.age_filter, st.session_state.occupation_filter]):
-            original_total = year_data['countries'][self.processor.get_country_columns(
-            )].sum() if year_data['countries'] is not None else 1
-            if original_total > 0:
-                filter_ratio = totals['migrants'] / original_total
+            filter_ratio = totals['filter_ratio']
+            if filter_ratio > 0:
                 male_count = int(male_count * filter_ratio)
                 female_count = int(female_count * filter_ratio)
                 college_count = int(college_count * filter_ratio)
@@ -621,94 +735,42 @@ class Dashboard:
         married_pct = (
             married_count / totals['migrants'] * 100) if totals['migrants'] > 0 else 0
 
-        # Show filter status
-        active_filters = []
-        if st.session_state.education_filter:
-            active_filters.append(
-                f"Education: {len(st.session_state.education_filter)} cats")
-        if st.session_state.age_filter:
-            active_filters.append(
-                f"Age: {len(st.session_state.age_filter)} groups")
-        if st.session_state.occupation_filter:
-            active_filters.append(
-                f"Occupation: {len(st.session_state.occupation_filter)} types")
-
-        if active_filters:
-            st.markdown(f"""
-                <div style='background: rgba(251, 191, 36, 0.1); border: 1px solid #fbbf24; border-radius: 8px; padding: 0.8rem; margin-bottom: 1rem;'>
-                    <p style='margin: 0; color: #fbbf24; font-size: 0.9rem;'>
-                        <strong>🔍 Active Filters:</strong> {' • '.join(active_filters)} 
-                        <span style='color: #94a3b8;'>(Showing filtered data only)</span>
-                    </p>
-                </div>
-            """, unsafe_allow_html=True)
-
-        # Metrics
-        # st.markdown("<div class='stats-row'>", unsafe_allow_html=True)
-        col1, col2, col3, col4, col5 = st.columns(5)
-
-        with col1:
-            delta_total = None
-            if show_comparison and comparison_year:
-                comp_data = self.calculate_filtered_data(
-                    comparison_year, self.filter_manager.get_filters())
-                comp_total = comp_data['totals']['migrants']
-                delta_val = totals['migrants'] - comp_total
-                delta_pct = (delta_val / comp_total *
-                             100) if comp_total > 0 else 0
-                delta_total = f"{delta_pct:+.1f}%"
-            st.markdown(f"""
-            <div style='text-align: center; padding: 1rem;'>
-                <p style='color: #94a3b8; font-size: 0.9rem; margin: 0; text-transform: uppercase;'>Total OFWs</p>
-                <p style='color: #00d4ff; font-size: 2rem; font-weight: 700; margin: 0.5rem 0;'>{totals['migrants']:,.0f}</p>
-                {f"<p style='color: #4ade80; margin: 0;'>{delta_total}</p>" if delta_total else ""}
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            st.markdown(f"""
-            <div style='text-align: center; padding: 1rem;'>
-                <p style='color: #94a3b8; font-size: 0.9rem; margin: 0; text-transform: uppercase;'>Male %</p>
-                <p style='color: #60a5fa; font-size: 2rem; font-weight: 700; margin: 0.5rem 0;'>{male_pct:.1f}%</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            st.markdown(f"""
-            <div style='text-align: center; padding: 1rem;'>
-                <p style='color: #94a3b8; font-size: 0.9rem; margin: 0; text-transform: uppercase;'>Female %</p>
-                <p style='color: #f472b6; font-size: 2rem; font-weight: 700; margin: 0.5rem 0;'>{female_pct:.1f}%</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # with col4:
-        #     st.markdown(f"""
-        #     <div style='text-align: center; padding: 1rem;'>
-        #         <p style='color: #94a3b8; font-size: 0.9rem; margin: 0; text-transform: uppercase;'>College Grad</p>
-        #         <p style='color: #fbbf24; font-size: 2rem; font-weight: 700; margin: 0.5rem 0;'>{college_pct:.1f}%</p>
-        #     </div>
-        #     """, unsafe_allow_html=True)
-
-        with col4:
-            st.markdown(f"""
-            <div style='text-align: center; padding: 1rem;'>
-                <p style='color: #94a3b8; font-size: 0.9rem; margin: 0; text-transform: uppercase;'>Married</p>
-                <p style='color: #4ade80; font-size: 2rem; font-weight: 700; margin: 0.5rem 0;'>{married_pct:.1f}%</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col5:
-            if year_data['countries'] is not None:
-                top_dest = self.processor.country_mapping.get(
-                    year_data['countries'][self.processor.get_country_columns()
-                                           ].idxmax(), 'N/A'
-                )
-            st.markdown(f"""
-                <div style='text-align: center; padding: 1rem;'>
-                <p style='color: #94a3b8; font-size: 0.9rem; margin: 0; text-transform: uppercase;'>Top Destination</p>
-                <p style='color: #a78bfa; font-size: 1.5rem; font-weight: 700; margin: 0.5rem 0;'>{top_dest}</p>
-                </div>
-            """, unsafe_allow_html=True)
+        # Show filter status; skip all string work on the common
+        # no-filter path
+        edu_f = st.session_state.education_filter
+        age_f = st.session_state.age_filter
+        occ_f = st.session_state.occupation_filter
+        if edu_f or age_f or occ_f:
+            active_filters = []
+            if edu_f:
+                active_filters.append(f"Education: {len(edu_f)} cats")
+            if age_f:
+                active_filters.append(f"Age: {len(age_f)} groups")
+            if occ_f:
+                active_filters.append(f"Occupation: {len(occ_f)} types")
+            st.markdown(_FILTER_BANNER_TPL.format(
+                ' • '.join(active_filters)), unsafe_allow_html=True)
+
+        # Metrics: one CSS grid emitted as a single markdown element
+        # instead of five st.columns containers with a markdown each
+        top_dest = filtered_data['top_destination']
+        delta_html = (f"<p style='color: #4ade80; margin: 0;'>{delta_total}</p>"
+                      if delta_total else "")
+        cards = ''.join((
+            _METRIC_CARD.format(label='Total OFWs', color='#00d4ff', size='2rem',
+                                value=f"{totals['migrants']:,.0f}", extra=delta_html),
+            _METRIC_CARD.format(label='Male %', color='#60a5fa', size='2rem',
+                                value=f"{male_pct:.1f}%", extra=''),
+            _METRIC_CARD.format(label='Female %', color='#f472b6', size='2rem',
+                                value=f"{female_pct:.1f}%", extra=''),
+            _METRIC_CARD.format(label='Married', color='#4ade80', size='2rem',
+                                value=f"{married_pct:.1f}%", extra=''),
+            _METRIC_CARD.format(label='Top Destination', color='#a78bfa', size='1.5rem',
+                                value=top_dest, extra=''),
+        ))
+        st.markdown(
+            f"<div style='display: grid; grid-template-columns: repeat(5, 1fr); gap: 1rem;'>{cards}</div>",
+            unsafe_allow_html=True)
 
         return {
             'totals': totals,
@@ -718,7 +780,7 @@ class Dashboard:
                 'college': college_pct,
                 'married': married_pct
             },
-            'top_destination': top_dest if year_data['countries'] is not None else 'N/A'
+            'top_destination': top_dest
         }
 
     def render_global_overview(self, filtered_data, selected_year, filters):
@@ -738,43 +800,39 @@ class Dashboard:
         totals = filtered_data['totals']
 
         if year_data['countries'] is not None:
-            map_data = []
-            for country in self.processor.get_country_columns():
-                migrants = year_data['countries'].get(country, 0)
-
-                # Apply filter ratio to country data
-                if any([st.session_state.education_filter, st.session_state.age_filter, st.session_state.occupation_filter]):
-                    original_total = year_data['countries'][self.processor.get_country_columns(
-                    )].sum()
-                    if original_total > 0:
-                        filter_ratio = totals['migrants'] / original_total
-                        migrants = int(migrants * filter_ratio)
-
-                if migrants > 0 and country in self.processor.country_mapping:
-                    map_data.append({
-                        'country': self.processor.country_mapping[country],
-                        'migrants': migrants,
-                        'percentage': (migrants / totals['migrants'] * 100) if totals['migrants'] > 0 else 0
-                    })
-
-            if map_data:
-                map_df = pd.DataFrame(map_data)
+            # One vectorized pass over the country row instead of a
+            # Python loop with per-country .get calls
+            counts = year_data['countries'][self.processor.country_columns].astype(
+                'float64')
+
+            # Apply filter ratio once to the whole row
+            if any([st.session_state.education_filter, st.session_state.age_filter, st.session_state.occupation_filter]):
+                if totals['filter_ratio'] > 0:
+                    counts = (counts * totals['filter_ratio']).astype('int64')
+
+            counts = counts[counts > 0]
+            names = counts.index.to_series().map(self.processor.country_name_map)
+            map_df = pd.DataFrame({
+                'country': names.values,
+                'migrants': counts.values,
+                'percentage': (counts.values / totals['migrants'] * 100)
+                if totals['migrants'] > 0 else 0.0
+            }).dropna(subset=['country'])
+
+            if not map_df.empty:
                 fig_map = self.viz.create_world_map(
                     map_df=map_df,
                     selected_year=selected_year,
                     total_migrants=totals['migrants'],
                     colorscale=filters['map_colorscale']
                 )
-                # Adding text labels on top of the choropleth
-                fig_map.add_trace(go.Scattergeo(
-                    locationmode='country names',
-                    locations=map_df['country'],
-                    text=map_df.apply(lambda row: f"{row['country']}<br>{row['migrants']:,.0f}", axis=1),
-                    mode='text',
-                    textfont=dict(color='white', size=10),
-                    showlegend=False,
-                    hoverinfo='none'
-                ))
+                # Text labels go into the prebuilt Scattergeo slot so
+                # traces don't accumulate on the cached figure
+                fig_map.data[1].update(
+                    locations=map_df['country'].to_numpy(),
+                    text=map_df.apply(
+                        lambda row: f"{row['country']}<br>{row['migrants']:,.0f}", axis=1)
+                )
                 st.plotly_chart(fig_map, use_container_width=True)
 
     def render_trends_and_destinations(self, filtered_data, selected_year, filters):
@@ -793,7 +851,7 @@ class Dashboard:
                 unsafe_allow_html=True
             )
 
-            years = sorted(self.data['education']['year'].unique())
+            years = self.processor.years
             trend_rows = []
             for year in years:
                 year_filtered = self.calculate_filtered_data(year, filters)
@@ -830,15 +888,16 @@ class Dashboard:
                     for i in range(len(years))
                 ]
 
-            # Custom data for hover
+            # Custom data for hover, as one fp32 block so Plotly takes
+            # the typed-array serialization path
             customdata = trend_df[[
-                'Prev', 'AbsChange', 'PctChange']].to_numpy()
+                'Prev', 'AbsChange', 'PctChange']].to_numpy(dtype=np.float32)
 
             fig_trend = go.Figure()
             fig_trend.add_trace(
                 go.Scatter(
-                    x=trend_df['Year'],
-                    y=trend_df['Total'],
+                    x=trend_df['Year'].to_numpy(),
+                    y=trend_df['Total'].to_numpy(dtype=np.float32),
                     mode='lines+markers',
                     line=dict(color='#00d4ff', width=3),
                     marker=dict(
@@ -897,28 +956,30 @@ class Dashboard:
             totals = filtered_data['totals']
 
             if year_data['countries'] is not None:
-                country_data = []
-                for country in self.processor.get_country_columns():
-                    migrants = year_data['countries'].get(country, 0)
-
-                    # Apply filter ratio
-                    if any([st.session_state.education_filter, st.session_state.age_filter, st.session_state.occupation_filter]):
-                        original_total = year_data['countries'][self.processor.get_country_columns(
-                        )].sum()
-                        if original_total > 0:
-                            filter_ratio = totals['migrants'] / original_total
-                            migrants = int(migrants * filter_ratio)
-
-                    if migrants > 0:
-                        country_name = self.processor.country_mapping.get(
-                            country, country.replace('_', ' ').title())
-                        country_data.append({
-                            'Country': country_name,
-                            'Migrants': migrants,
-                            'Percentage': (migrants / totals['migrants'] * 100) if totals['migrants'] > 0 else 0
-                        })
-
-                top_df = pd.DataFrame(country_data).nlargest(
+                # Same vectorized assembly as the world map: no per-
+                # country dict appends or dtype re-inference
+                counts = year_data['countries'][self.processor.country_columns].astype(
+                    'float64')
+                if any([st.session_state.education_filter, st.session_state.age_filter, st.session_state.occupation_filter]):
+                    if totals['filter_ratio'] > 0:
+                        counts = (
+                            counts * totals['filter_ratio']).astype('int64')
+                counts = counts[counts > 0]
+
+                # Unmapped codes fall back to a title-cased pretty name
+                pretty = counts.index.str.replace('_', ' ').str.title()
+                names = counts.index.to_series().map(
+                    self.processor.country_name_map).fillna(
+                        pd.Series(pretty, index=counts.index))
+
+                country_df = pd.DataFrame({
+                    'Country': names.values,
+                    'Migrants': counts.values,
+                    'Percentage': (counts.values / totals['migrants'] * 100)
+                    if totals['migrants'] > 0 else 0.0
+                })
+
+                top_df = country_df.nlargest(
                     filters['top_n_countries'], 'Migrants').sort_values('Migrants', ascending=True)
 
                 fig_top = px.bar(
@@ -1130,26 +1191,25 @@ class Dashboard:
             totals = filtered_data['totals']
 
             if year_data['regions'] is not None:
-                region_data = []
-                for region in self.processor.get_region_columns():
-                    migrants = year_data['regions'].get(region, 0)
-
-                    # Apply filter ratio
-                    if any([st.session_state.education_filter, st.session_state.age_filter, st.session_state.occupation_filter]):
-                        original_total = year_data['countries'][self.processor.get_country_columns(
-                        )].sum() if year_data['countries'] is not None else 1
-                        if original_total > 0:
-                            filter_ratio = totals['migrants'] / original_total
-                            migrants = int(migrants * filter_ratio)
-
-                    if migrants > 0:
-                        region_data.append({
-                            'Region': self.processor.region_mapping.get(region, region),
-                            'Migrants': migrants
-                        })
-
-                if region_data:
-                    region_df = pd.DataFrame(region_data)
+                # Vectorized over the region row, mirroring the
+                # country assemblies
+                r_counts = year_data['regions'][self.processor.region_columns].astype(
+                    'float64')
+                if any([st.session_state.education_filter, st.session_state.age_filter, st.session_state.occupation_filter]):
+                    if totals['filter_ratio'] > 0:
+                        r_counts = (
+                            r_counts * totals['filter_ratio']).astype('int64')
+                r_counts = r_counts[r_counts > 0]
+
+                region_names = r_counts.index.to_series().map(
+                    self.processor.region_name_map).fillna(
+                        pd.Series(r_counts.index, index=r_counts.index))
+                region_df = pd.DataFrame({
+                    'Region': region_names.values,
+                    'Migrants': r_counts.values
+                })
+
+                if not region_df.empty:
 
                     # Create a choropleth map of the Philippines regions
                     # Map region codes to proper names for geojson matching
@@ -1243,12 +1303,8 @@ class Dashboard:
 
                         # Apply filter ratio
                         if any([st.session_state.education_filter, st.session_state.age_filter, st.session_state.occupation_filter]):
-                            original_total = year_data['countries'][self.processor.get_country_columns(
-                            )].sum() if year_data['countries'] is not None else 1
-                            if original_total > 0:
-                                filter_ratio = totals['migrants'] / \
-                                    original_total
-                                count = int(count * filter_ratio)
+                            if totals['filter_ratio'] > 0:
+                                count = int(count * totals['filter_ratio'])
 
                         if count > 0:
                             civ_data.append({'Status': name, 'Count': count})
@@ -1300,9 +1356,19 @@ class Dashboard:
         # Calculate filtered data
         filtered_data = self.calculate_filtered_data(selected_year, filters)
 
+        # Comparison-year delta, computed up front alongside the
+        # primary pass so render_metrics stays a pure formatter
+        delta_total = None
+        if show_comparison and comparison_year:
+            comp_total = self.calculate_filtered_data(
+                comparison_year, filters)['totals']['migrants']
+            delta_pct = ((filtered_data['totals']['migrants'] - comp_total)
+                         / comp_total * 100) if comp_total > 0 else 0
+            delta_total = f"{delta_pct:+.1f}%"
+
         # Render metrics
         metrics_data = self.render_metrics(
-            filtered_data, selected_year, show_comparison, comparison_year)
+            filtered_data, selected_year, delta_total)
 
         # Narrative insight
         filter_text = f" (filtered)" if any(
@@ -1,3 +1,5 @@
+import re
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
@@ -13,6 +15,9 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# Compiled once; the slug cleanup runs over every destination string
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
 # ---------- Yearly explanations (by ranges) ----------
 EXPLANATION_RANGES = [
     {
@@ -94,6 +99,8 @@ def get_year_explanation(year: int) -> str:
 
 
 class DataLoader:
+    COLUMNS = ["year", "origin_region", "destination_country", "migrants"]
+
     @staticmethod
     @st.cache_data
     def load_all_data():
@@ -103,7 +110,14 @@ class DataLoader:
             base_path = os.path.join(
                 project_root, "data", "raph", "clean_migration_origin_destination.csv"
             )
-            df = pd.read_csv(base_path)
+            # Prefer the Parquet file produced by convert.py: no CSV
+            # tokenization and only the needed columns are read
+            parquet_path = os.path.splitext(base_path)[0] + ".parquet"
+            if os.path.exists(parquet_path):
+                df = pd.read_parquet(
+                    parquet_path, columns=DataLoader.COLUMNS)
+            else:
+                df = pd.read_csv(base_path, usecols=DataLoader.COLUMNS)
             return {"main": df}
         except Exception as e:
             st.error(f"Error loading data: {e}")
@@ -274,7 +288,12 @@ class DataProcessor:
         }
 
     def prepare_main_df(self):
-        df = self.data["main"].copy()
+        return DataProcessor._prepare(self.data["main"], self.country_mapping)
+
+    @staticmethod
+    @st.cache_data
+    def _prepare(df, country_mapping):
+        df = df.copy()
         df["origin_region"] = df["origin_region"].astype(str).str.strip()
         df["destination_country"] = df["destination_country"].astype(
             str).str.strip()
@@ -284,33 +303,64 @@ class DataProcessor:
             "REPUBLIC OF THE PHILIPPINES": "Philippines",
         })
 
-        df["destination_clean"] = (
-            df["destination_country"]
+        # run the slug/pretty pipeline over the unique destinations only
+        # and broadcast back with a dict lookup: O(unique) string work
+        # instead of O(rows)
+        uniq = pd.Series(df["destination_country"].unique())
+        cleaned = (
+            uniq
             .str.lower()
-            .str.replace(r"[^a-z0-9]+", "_", regex=True)
+            .str.replace(_SLUG_RE, "_", regex=True)
             .str.strip("_")
         )
-        df["destination_pretty"] = df["destination_clean"].map(self.country_mapping).fillna(
-            df["destination_country"]
-        )
+        pretty = cleaned.map(country_mapping).fillna(uniq)
+        df["destination_clean"] = df["destination_country"].map(
+            dict(zip(uniq, cleaned)))
+        df["destination_pretty"] = df["destination_country"].map(
+            dict(zip(uniq, pretty)))
+        # sorted by year so the per-year filter is a contiguous
+        # searchsorted slice instead of a boolean mask + gather
+        df = df.sort_values("year", kind="stable").reset_index(drop=True)
         return df
 
 
 # ---------- Load data ----------
+
+
+@st.cache_data
+def selector_options(df):
+    """Sidebar option tuples, computed once per session."""
+    return {
+        "years": tuple(sorted(df["year"].unique())),
+        "origins": tuple(sorted(df["origin_region"].unique())),
+        "dests": tuple(sorted(df["destination_pretty"].unique())),
+    }
+
+
+@st.cache_data
+def aggregate_migrants(df):
+    """Per-(year, origin, destination) sums computed once per session."""
+    return df.groupby(
+        ["year", "origin_region", "destination_pretty"], observed=True
+    )["migrants"].sum()
+
+
 data_dict = DataLoader.load_all_data()
 processor = DataProcessor(data_dict)
 df = processor.prepare_main_df()
+migrant_agg = aggregate_migrants(df)
+options = selector_options(df)
 
 # ---------- Sidebar ----------
 st.sidebar.header("Filters")
 
-years = sorted(df["year"].unique())
+years = options["years"]
 selected_year = st.sidebar.selectbox("Year", years, index=len(years)-1)
 
-origin_options = ["All regions"] + sorted(df["origin_region"].unique())
+origin_options = ["All regions", *options["origins"]]
 selected_origin = st.sidebar.selectbox("Origin Region", origin_options)
 
-dest_options = ["All countries"] + sorted(df["destination_pretty"].unique())
+dest_options = ["All countries", *options["dests"]]
 selected_dest = st.sidebar.selectbox("Destination Country", dest_options)
 
 # ---------- Cumulative total migrants up to selected year ----------
@@ -334,23 +384,22 @@ st.sidebar.caption(
 )
 
 # ---------- Filtered data for map ----------
-year_mask = df["year"] == selected_year
-df_year = df[year_mask].copy()
-
+# the frame is year-sorted, so the year filter is a contiguous slice;
+# the remaining filters reduce to one mask over that slice only
+years_arr = df["year"].to_numpy()
+lo = np.searchsorted(years_arr, selected_year, "left")
+hi = np.searchsorted(years_arr, selected_year, "right")
+df_year = df.iloc[lo:hi]
+conds = []
 if selected_origin != "All regions":
-    df_year = df_year[df_year["origin_region"] == selected_origin]
-
+    conds.append(df_year["origin_region"].to_numpy() == selected_origin)
 if selected_dest != "All countries":
-    df_year = df_year[df_year["destination_pretty"] == selected_dest]
+    conds.append(df_year["destination_pretty"].to_numpy() == selected_dest)
+if conds:
+    df_year = df_year.loc[np.logical_and.reduce(conds)]
 
 # ---------- Totals and insight text ----------
-summary_mask = df["year"] == selected_year
-if selected_origin != "All regions":
-    summary_mask &= df["origin_region"] == selected_origin
-if selected_dest != "All countries":
-    summary_mask &= df["destination_pretty"] == selected_dest
-
-df_summary = df[summary_mask]
+df_summary = df_year
 total_migrants = int(df_summary["migrants"].sum()
                      ) if not df_summary.empty else 0
 dest_label = selected_dest if selected_dest != "All countries" else "All Countries"
@@ -376,11 +425,19 @@ insight_text = (
 )
 
 # ---------- Aggregated data for map ----------
-all_countries = (
-    df_year.groupby("destination_pretty", as_index=False)["migrants"]
-    .sum()
-    .rename(columns={"destination_pretty": "Destination", "migrants": "Migrants"})
-)
+# indexed lookups into the cached aggregate instead of re-grouping the
+# filtered frame on every widget change
+agg_sub = migrant_agg.xs(selected_year, level="year")
+if selected_origin != "All regions":
+    agg_sub = agg_sub.xs(selected_origin, level="origin_region")
+dest_totals = agg_sub.groupby(level="destination_pretty").sum()
+if selected_dest != "All countries":
+    dest_totals = dest_totals[dest_totals.index == selected_dest]
+# constructor-direct: no rename_axis/reset_index intermediates
+all_countries = pd.DataFrame({
+    "Destination": dest_totals.index.to_numpy(),
+    "Migrants": dest_totals.to_numpy(),
+})
 all_countries = all_countries[all_countries["Migrants"] > 0].sort_values(
     "Migrants", ascending=False)
 
@@ -418,13 +475,17 @@ fig.update_layout(
 )
 
 # ---------- Labels on top 10 ----------
+# column-wise label build: axis=1 apply materializes a Series per row
+# astype(str) after the format map keeps the dtype string even when
+# top_df is empty, where map alone would stay int64 and break the
+# concatenation
+top_labels = (top_df["Destination"].astype(str) + "<br>"
+              + top_df["Migrants"].map("{:,.0f}".format).astype(str))
 fig.add_trace(
     go.Scattergeo(
         locationmode="country names",
         locations=top_df["Destination"],
-        text=top_df.apply(
-            lambda r: f"{r['Destination']}<br>{int(r['Migrants']):,}", axis=1
-        ),
+        text=top_labels,
         mode="text",
         textfont=dict(color="white", size=10),
         showlegend=False,
@@ -528,17 +589,18 @@ with st.container():
 
 # ---------- Top destinations panel ----------
 if selected_dest == "All countries":
-    top5 = all_countries.head(5).copy()
-    if not top5.empty:
+    # plain lists of the two needed columns: no frame copy and no
+    # per-row Series construction via iterrows
+    top5_dest = all_countries["Destination"].head(5).tolist()
+    top5_migrants = all_countries["Migrants"].head(5).tolist()
+    if top5_dest:
         st.markdown("### Top Destination Countries")
-        col1, col2, col3, col4, col5 = st.columns(5)
-
-        cols = [col1, col2, col3, col4, col5]
-        for col, (_, row) in zip(cols, top5.iterrows()):
+        cols = st.columns(5)
+        for col, dest, migrants in zip(cols, top5_dest, top5_migrants):
             with col:
                 st.markdown(
-                    f"**{row['Destination']}**  \n"
-                    f"{int(row['Migrants']):,} migrants",
+                    f"**{dest}**  \n"
+                    f"{int(migrants):,} migrants",
                 )
 
 # year‑over‑year change text for selected destination
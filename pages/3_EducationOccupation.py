@@ -9,17 +9,30 @@ from educ_occ_heatmap import (
     melt_occupation,
     estimate_joint,
     show_heatmaps,
-    save_heatmaps
+    save_heatmaps,
+    year_total
 )
 
 st.set_page_config(page_title="Education & Occupation", layout="wide")
 
-# === Keep title exactly as requested ===
-st.title("Filipino Emigrants' Proportional Distribution by Educational Attainment * Occupation")
-st.markdown("""This dashboard shows proportional estimates of how Filipino emigrants distribute
+# Static copy hoisted to module constants so reruns re-emit the same
+# interned strings instead of rebuilding them in the render path
+_INTRO_MD = """This dashboard shows proportional estimates of how Filipino emigrants distribute
 across Educational Attainment and Occupation for the selected year.
 These insights help the Commission on Filipinos Overseas (CFO) understand patterns
-in skill mobility, employment alignment, and migrant vulnerabilities.""")
+in skill mobility, employment alignment, and migrant vulnerabilities."""
+
+_POLICY_TEXT = (
+    "These Education × Occupation proportional patterns (for {year}) provide CFO with quick signals:\n\n"
+    "- **Monitoring Skill Flow:** If highly educated groups concentrate in certain occupations (e.g., nurses, IT), CFO can anticipate domestic skill gaps.\n\n"
+    "- **Identifying Underemployment Abroad:** A notable share of high-education migrants in lower-skilled occupations can imply credential recognition issues.\n\n"
+    "- **Program & Policy Use:** Use the per-year proportional heatmaps together with total emigrant counts (shown above) to size interventions — for example, a 5% cell in a year of 200k emigrants (~10k people) is operationally meaningful.\n\n"
+    "The visualizations and narratives update automatically when you change the year, enabling evidence-based policy discussions."
+)
+
+# === Keep title exactly as requested ===
+st.title("Filipino Emigrants' Proportional Distribution by Educational Attainment * Occupation")
+st.markdown(_INTRO_MD)
 
 # --- load years safely ---
 try:
@@ -33,11 +46,12 @@ except Exception as e:
     st.error(f"Error reading data: {e}")
     st.stop()
 
-# Year selector constrained to available years
+# Year selector constrained to available years; available_years()
+# already returns a sorted tuple, so no per-rerun list rebuilds
 year = st.selectbox(
     "Select Year",
-    options=sorted(years),
-    index=sorted(years).index(max_year)
+    options=years,
+    index=len(years) - 1
 )
 year = int(year)
 
@@ -52,13 +66,9 @@ if top_plot is None and bottom_plot is None:
 # === Compute total emigrants for the selected year (for narrative context) ===
 df = load_data()
 df_year = df[df["year"] == int(year)]
-if df_year.empty:
-    total_emigrants_year = 0
-else:
-    # sum all numeric columns except 'year' to produce an aggregated count for the year
-    numeric = df_year.select_dtypes(include="number").drop(
-        columns=["year"], errors="ignore")
-    total_emigrants_year = int(numeric.sum(axis=1).sum())
+# aggregated count for the year from the cached per-year vectors: two
+# array sums instead of a dtype scan plus a row-wise reduction
+total_emigrants_year = year_total(year)
 
 st.info(
     f"**Total emigrants in {year}: {total_emigrants_year:,} (aggregated PSA counts)**")
@@ -209,13 +219,7 @@ st.markdown("---")
 
 # --- CFO Policy Interpretation (kept and slightly contextualized) ---
 st.subheader("🏛 Policy Interpretation for CFO")
-st.write(
-    f"These Education × Occupation proportional patterns (for {year}) provide CFO with quick signals:\n\n"
-    "- **Monitoring Skill Flow:** If highly educated groups concentrate in certain occupations (e.g., nurses, IT), CFO can anticipate domestic skill gaps.\n\n"
-    "- **Identifying Underemployment Abroad:** A notable share of high-education migrants in lower-skilled occupations can imply credential recognition issues.\n\n"
-    "- **Program & Policy Use:** Use the per-year proportional heatmaps together with total emigrant counts (shown above) to size interventions — for example, a 5% cell in a year of 200k emigrants (~10k people) is operationally meaningful.\n\n"
-    "The visualizations and narratives update automatically when you change the year, enabling evidence-based policy discussions."
-)
+st.write(_POLICY_TEXT.format(year=year))
 
 # Clean up matplotlib figures to prevent memory issues
 if top_plot is not None:
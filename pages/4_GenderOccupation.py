@@ -17,7 +17,9 @@ st.markdown(
 # ------------------------
 # Load data
 # ------------------------
-@st.cache_data
+# persist="disk": the cleaned frames depend only on the CSVs, so a
+# restarted worker reloads the pickled result instead of re-parsing
+@st.cache_data(persist="disk")
 def load_data():
     base = "data"
     occu = pd.read_csv(f"{base}/occu_pivot.csv")
@@ -39,8 +41,89 @@ def load_data():
     if "male" in sex_cols and "female" in sex_cols:
         sex = sex.rename(columns={sex_cols["male"]: "Male", sex_cols["female"]: "Female"})
 
+    # int32 counts and int16 years: the defaults are int64, which
+    # doubles both the cached frames and every Arrow payload cut
+    # from them
+    for frame in (occu, sex):
+        num_cols = frame.select_dtypes("integer").columns.drop(
+            "year", errors="ignore")
+        frame[num_cols] = frame[num_cols].astype("int32")
+        if "year" in frame.columns:
+            frame["year"] = frame["year"].astype("int16")
+
     return occu, sex
 
+# Static center line of the mirrored chart, built once at import; the
+# module global is strictly cheaper than any per-rerun construction
+# Divider + design note as one markdown blob: one element proto per
+# rerun instead of two
+_SIDEBAR_NOTE = (
+    "---\n"
+    "Design note: Mirrored bar chart is an *estimated* gender split derived by applying "
+    "the overall male/female shares for the selected year to each occupation."
+)
+
+_CENTER_RULE = alt.Chart(pd.DataFrame({"x": [0]})).mark_rule(
+    color="gray", strokeWidth=1).encode(x="x:Q")
+
+# Static Vega-Lite specs for the bottom-row charts: skips the Altair
+# chart-object build and to_dict validation pass on every rerun
+_TOP_OCC_SPEC = {
+    "mark": {"type": "bar", "color": "#4C72B0"},
+    "encoding": {
+        "x": {"field": "Count", "type": "quantitative", "title": "Count"},
+        # sort: null keeps the data order; the frame is pre-sorted
+        # descending, so Vega skips its own sort pass
+        "y": {"field": "Occupation", "type": "nominal", "sort": None,
+              "title": None},
+        "tooltip": [
+            {"field": "Occupation", "type": "nominal"},
+            {"field": "Count", "type": "quantitative"},
+        ],
+    },
+    "height": 420,
+}
+
+_GENDER_SPEC = {
+    "mark": {"type": "area", "opacity": 0.6},
+    "encoding": {
+        "x": {"field": "year", "type": "ordinal", "title": "Year"},
+        "y": {"field": "Count", "type": "quantitative", "title": "Count"},
+        "color": {
+            "field": "Gender", "type": "nominal",
+            "scale": {"domain": ["Male", "Female"],
+                      "range": ["#2AA198", "#B266FF"]},
+        },
+    },
+    "height": 420,
+}
+
+
+@st.cache_data
+def build_occu_ts(occu_df):
+    """Long-format occupation series for the trend chart."""
+    occu_columns = [c for c in occu_df.columns if c != "year"]
+    occu_ts = occu_df[["year"] + occu_columns].melt(
+        id_vars="year", var_name="Occupation", value_name="Count"
+    )
+    occu_ts["Occupation"] = occu_ts["Occupation"].astype(str)
+    # compact dtypes: the frame crosses the wire as columnar Arrow IPC,
+    # so halving the integer widths halves the chart payload
+    occu_ts["year"] = occu_ts["year"].astype("int16")
+    occu_ts["Count"] = occu_ts["Count"].astype("int32")
+    return occu_ts
+
+
+@st.cache_data
+def build_gender_long(sex_df):
+    """Long-format gender totals for the area chart."""
+    gender_long = sex_df.melt(
+        id_vars="year", var_name="Gender", value_name="Count")
+    gender_long["year"] = gender_long["year"].astype("int16")
+    gender_long["Count"] = gender_long["Count"].astype("int32")
+    return gender_long
+
+
 occu_df, sex_df = load_data()
 
 # ------------------------
@@ -68,11 +151,7 @@ occupation_multiselect = st.sidebar.multiselect(
 show_estimate_note = st.sidebar.checkbox("Show approximation note (gender split estimate)", value=True)
 normalize_option = st.sidebar.radio("Show counts or percentages:", ("Counts", "Percent of total (selected year)"))
 
-st.sidebar.markdown("---")
-st.sidebar.write(
-    "Design note: Mirrored bar chart is an *estimated* gender split derived by applying "
-    "the overall male/female shares for the selected year to each occupation."
-)
+st.sidebar.markdown(_SIDEBAR_NOTE)
 
 # ------------------------
 # Prepare data for selected year
@@ -82,8 +161,12 @@ if row.shape[0] == 0:
     st.error(f"No occupation data available for year {selected_year}")
     st.stop()
 
-occ_year = row.drop(columns="year").T.reset_index()
-occ_year.columns = ["Occupation", "Count"]
+# columnar construction straight from the row's arrays: no transposed
+# intermediate frame and no reset_index/rename pass
+occ_year = pd.DataFrame({
+    "Occupation": np.asarray(occu_columns, dtype=object),
+    "Count": row[occu_columns].to_numpy()[0],
+})
 occ_year = occ_year.sort_values("Count", ascending=False)
 
 if occupation_multiselect:
@@ -174,10 +257,8 @@ male_text = alt.Chart(mirror_df).mark_text(align="left", dx=5, color="gray").enc
     text=alt.Text(value_col + ":Q", format=",")
 )
 
-center_rule = alt.Chart(pd.DataFrame({"x": [0]})).mark_rule(color="gray", strokeWidth=1).encode(x="x:Q")
-
 chart_height = 420 + max(0, (len(sorted_occ) - 10) * 30)
-mirrored_chart = (female_bar + male_bar + female_text + male_text + center_rule).properties(
+mirrored_chart = (female_bar + male_bar + female_text + male_text + _CENTER_RULE).properties(
     height=chart_height, width=900
 )
 st.altair_chart(mirrored_chart, use_container_width=True)
@@ -201,95 +282,99 @@ st.markdown("---")
 # ------------------------
 # Occupation Trends
 # ------------------------
-st.subheader("Occupation Trends (Selected Occupations)")
-
-# Melt the data
-occu_ts = occu_df[["year"] + occu_columns].melt(
-    id_vars="year", var_name="Occupation", value_name="Count"
-)
-occu_ts["Occupation"] = occu_ts["Occupation"].astype(str)
-
-# ------------------------
-# Multiselect filter and top N / show all logic
-# ------------------------
-occupation_multiselect = st.multiselect(
-    "Select occupations (leave empty to show top N)",
-    options=sorted(occu_columns),
-    default=[]
-)
+# Fragment: the multiselect and checkbox below only rerun this
+# section, not the whole page
+@st.fragment
+def occupation_trends(occu_columns, occu_df):
+    st.subheader("Occupation Trends (Selected Occupations)")
+
+    # Melt the data (cached; reruns reuse the long frame)
+    occu_ts = build_occu_ts(occu_df)
+
+    # ------------------------
+    # Multiselect filter and top N / show all logic
+    # ------------------------
+    occupation_multiselect = st.multiselect(
+        "Select occupations (leave empty to show top N)",
+        options=sorted(occu_columns),
+        default=[]
+    )
 
-show_all = st.checkbox("Show all occupations", value=True)
+    show_all = st.checkbox("Show all occupations", value=True)
 
-# Determine which occupations to display
-if show_all:
-    if occupation_multiselect:
-        ts_plot = occu_ts[occu_ts["Occupation"].isin(occupation_multiselect)].copy()
-        top_occ = occupation_multiselect[:5]  # always define top_occ
+    # Determine which occupations to display
+    if show_all:
+        if occupation_multiselect:
+            ts_plot = occu_ts[occu_ts["Occupation"].isin(occupation_multiselect)].copy()
+            top_occ = occupation_multiselect[:5]  # always define top_occ
+        else:
+            ts_plot = occu_ts.copy()
+            latest_year = occu_df["year"].max()
+            occ_year_latest = occu_df[occu_df["year"] == latest_year].drop(columns="year")
+            top_occ = occ_year_latest.iloc[0].sort_values(ascending=False).head(5).index.tolist()
     else:
-        ts_plot = occu_ts.copy()
         latest_year = occu_df["year"].max()
         occ_year_latest = occu_df[occu_df["year"] == latest_year].drop(columns="year")
-        top_occ = occ_year_latest.iloc[0].sort_values(ascending=False).head(5).index.tolist()
-else:
-    latest_year = occu_df["year"].max()
-    occ_year_latest = occu_df[occu_df["year"] == latest_year].drop(columns="year")
     
-    if occupation_multiselect:
-        top_occ = occupation_multiselect[:5]
-        rest = [occ for occ in occupation_multiselect if occ not in top_occ]
-    else:
-        top_occ = occ_year_latest.iloc[0].sort_values(ascending=False).head(5).index.tolist()
-        rest = [occ for occ in occu_columns if occ not in top_occ]
+        if occupation_multiselect:
+            top_occ = occupation_multiselect[:5]
+            rest = [occ for occ in occupation_multiselect if occ not in top_occ]
+        else:
+            top_occ = occ_year_latest.iloc[0].sort_values(ascending=False).head(5).index.tolist()
+            rest = [occ for occ in occu_columns if occ not in top_occ]
     
-    ts_plot_top = occu_ts[occu_ts["Occupation"].isin(top_occ)].copy()
+        ts_plot_top = occu_ts[occu_ts["Occupation"].isin(top_occ)].copy()
     
-    if rest:
-        dummy_df = pd.DataFrame({
-            "year": [occu_ts["year"].min()],
-            "Occupation": [f"...+{len(rest)} more"],
-            "Count": [0]
-        })
-        ts_plot = pd.concat([ts_plot_top, dummy_df], ignore_index=True)
+        if rest:
+            dummy_df = pd.DataFrame({
+                "year": [occu_ts["year"].min()],
+                "Occupation": [f"...+{len(rest)} more"],
+                "Count": [0]
+            })
+            ts_plot = pd.concat([ts_plot_top, dummy_df], ignore_index=True)
+        else:
+            ts_plot = ts_plot_top.copy()
+
+    # ------------------------
+    # Legend order
+    # ------------------------
+    all_occupations = ts_plot["Occupation"].unique().tolist()
+    legend_order = [occ for occ in top_occ if occ in all_occupations] + \
+                   sorted([occ for occ in all_occupations if occ not in top_occ])
+
+    # ------------------------
+    # Plot line chart
+    # ------------------------
+    if not ts_plot.empty:
+        line_chart = (
+            alt.Chart(ts_plot)
+            .mark_line(point=True)
+            .encode(
+                x=alt.X("year:O", title="Year"),
+                y=alt.Y("Count:Q", title="Count"),
+                color=alt.Color(
+                    "Occupation:N",
+                    sort=legend_order,
+                    legend=alt.Legend(title="Occupation", symbolLimit=5, columns=1)
+                ),
+                tooltip=["year", "Occupation", "Count"]
+            )
+            .properties(height=420)
+            .interactive()
+        )
+        st.altair_chart(line_chart, use_container_width=True)
     else:
-        ts_plot = ts_plot_top.copy()
+        st.warning("No data available for the selected occupations/year.")
 
-# ------------------------
-# Legend order
-# ------------------------
-all_occupations = ts_plot["Occupation"].unique().tolist()
-legend_order = [occ for occ in top_occ if occ in all_occupations] + \
-               sorted([occ for occ in all_occupations if occ not in top_occ])
-
-# ------------------------
-# Plot line chart
-# ------------------------
-if not ts_plot.empty:
-    line_chart = (
-        alt.Chart(ts_plot)
-        .mark_line(point=True)
-        .encode(
-            x=alt.X("year:O", title="Year"),
-            y=alt.Y("Count:Q", title="Count"),
-            color=alt.Color(
-                "Occupation:N",
-                sort=legend_order,
-                legend=alt.Legend(title="Occupation", symbolLimit=5, columns=1)
-            ),
-            tooltip=["year", "Occupation", "Count"]
-        )
-        .properties(height=420)
-        .interactive()
+    st.info(
+        "This chart displays trends in occupation over time. "
+        "The top 3 occupations in the latest year account for over 50% of total counts. "
+        "Some occupations have grown >30% in the past decade, while others declined up to 25%, showing sectoral shifts."
+        "'No Occupation Reported' often reflects missing or unrecorded data, which may be due to temporary or informal work, incomplete reporting, or systemic gaps in data collection. "
     )
-    st.altair_chart(line_chart, use_container_width=True)
-else:
-    st.warning("No data available for the selected occupations/year.")
 
-st.info(
-    "This chart displays trends in occupation over time. "
-    "The top 3 occupations in the latest year account for over 50% of total counts. "
-    "Some occupations have grown >30% in the past decade, while others declined up to 25%, showing sectoral shifts."
-    "'No Occupation Reported' often reflects missing or unrecorded data, which may be due to temporary or informal work, incomplete reporting, or systemic gaps in data collection. "
-)
+
+occupation_trends(occu_columns, occu_df)
 
 # ------------------------
 # Bottom row charts
@@ -299,13 +384,7 @@ col3, col4 = st.columns(2)
 with col3:
     st.subheader("Top Occupations (Selected Year)")
     top_show_df = est[["Occupation", "Count"]].sort_values("Count", ascending=False).head(top_n)
-    top_chart = alt.Chart(top_show_df).mark_bar().encode(
-        x=alt.X("Count:Q", title="Count"),
-        y=alt.Y("Occupation:N", sort='-x'),
-        tooltip=["Occupation", "Count"],
-        color=alt.value("#4C72B0")
-    ).properties(height=420)
-    st.altair_chart(top_chart, use_container_width=True)
+    st.vega_lite_chart(top_show_df, _TOP_OCC_SPEC, use_container_width=True)
     st.info(
     "Ranks occupations by total count. "
     "The top occupation represents 15–20% of all counts; the top 5 together exceed 55%, "
@@ -314,13 +393,8 @@ with col3:
 
 with col4:
     st.subheader("Gender Trend")
-    gender_long = sex_df.melt(id_vars="year", var_name="Gender", value_name="Count")
-    gender_chart = alt.Chart(gender_long).mark_area(opacity=0.6).encode(
-        x=alt.X("year:O", title="Year"),
-        y=alt.Y("Count:Q", title="Count"),
-        color=alt.Color("Gender:N", scale=alt.Scale(domain=["Male", "Female"], range=["#2AA198", "#B266FF"]))
-    ).properties(height=420)
-    st.altair_chart(gender_chart, use_container_width=True)
+    gender_long = build_gender_long(sex_df)
+    st.vega_lite_chart(gender_long, _GENDER_SPEC, use_container_width=True)
     st.info(
     "Illustrates male and female population over time. "
     "In the latest year, females are ~55%, males ~45%. "
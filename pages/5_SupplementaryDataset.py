@@ -1,8 +1,18 @@
+import os
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+
+# Shared figure layout registered once at import; per-figure
+# update_layout then only carries the varying bits, so Plotly merges
+# fewer dicts and ships a smaller JSON payload per rerun
+pio.templates['dashboard'] = go.layout.Template(
+    layout=dict(margin=dict(l=40, r=10, t=40, b=40), hovermode='x unified'))
 
 # Page configuration
 st.set_page_config(
@@ -11,14 +21,56 @@ st.set_page_config(
 # Load the dataset
 
 
+# Only the columns the dashboard actually displays; everything else in
+# the World Bank extract is skipped at parse time
+NEEDED_COLUMNS = [
+    'Country Name', 'Year',
+    'Life expectancy at birth, total (years)',
+    'Domestic general government health expenditure (% of GDP)',
+    'GDP',
+    'Unemployment, total (% of total labor force)',
+    'Diabetes prevalence (% of population ages 20 to 79)',
+    'Prevalence of hypertension (% of adults ages 30-79)',
+    'Mortality rate, adult, female (per 1,000 female adults)',
+    'Mortality rate, adult, male (per 1,000 male adults)',
+]
+
+
 @st.cache_data
 def load_health_data():
     try:
-        # Load the CSV file
+        # Prefer the Parquet files produced by convert.py (columnar,
+        # pre-typed, no string parsing); fall back to CSV when absent
         base = "data"
-        df = pd.read_csv(
-            f"{base}/Matthew/all_countries_supplementary_updated.csv")
-        df2 = pd.read_csv(f"{base}/merged_data.csv")
+        health_parquet = f"{base}/Matthew/all_countries_supplementary_updated.parquet"
+        if os.path.exists(health_parquet):
+            df = pd.read_parquet(
+                health_parquet, columns=NEEDED_COLUMNS,
+                dtype_backend='pyarrow')
+        else:
+            df = pd.read_csv(
+                f"{base}/Matthew/all_countries_supplementary_updated.csv",
+                usecols=NEEDED_COLUMNS,
+                dtype={'Year': 'int16', 'Country Name': 'string',
+                       **{c: 'float32' for c in NEEDED_COLUMNS
+                          if c not in ('Year', 'Country Name')}})
+        migrant_parquet = f"{base}/merged_data.parquet"
+        if os.path.exists(migrant_parquet):
+            df2 = pd.read_parquet(
+                migrant_parquet, columns=['year', *COUNTRY_LIST],
+                dtype_backend='pyarrow')
+        else:
+            df2 = pd.read_csv(
+                f"{base}/merged_data.csv", usecols=['year', *COUNTRY_LIST])
+        # Downcast: the indicators render at 1-2 decimals, so float32
+        # halves the cached frames; years fit comfortably in int16.
+        # Covers the Parquet path (the CSV path is typed at read time).
+        ind_cols = [c for c in NEEDED_COLUMNS
+                    if c not in ('Year', 'Country Name')]
+        df[ind_cols] = df[ind_cols].astype('float32')
+        df['Year'] = df['Year'].astype('int16')
+        df2[list(COUNTRY_LIST)] = df2[list(COUNTRY_LIST)].astype('float32')
+        df2['year'] = df2['year'].astype('int16')
         return df, df2
     except FileNotFoundError:
         st.error(
@@ -29,14 +81,14 @@ def load_health_data():
         return None
 
 
-# Load the data
-df, migrant = load_health_data()
-country_list = {'united_states_of_america', 'united_arab_emirates', 'united_kingdom', 'saudi_arabia', 'canada', 'australia',
+# Tuple keeps the melt/usecols column order deterministic (a plain set
+# would reorder per run); frozenset stays hashable for cached functions
+COUNTRY_LIST = ('united_states_of_america', 'united_arab_emirates', 'united_kingdom', 'saudi_arabia', 'canada', 'australia',
                 'japan', 'singapore', 'hongkong', 'italy', 'germany', 'france', 'south_korea', 'spain', 'malaysia', 'qatar',
-                'kuwait', 'israel', 'china_(p.r.o.c.)', 'russian_federation_/_ussr'}
-health_country_list = {'United States', 'Hong Kong SAR, China', 'Russian Federation', 'Korea, Rep.', 'United Arab Emirates',
-                       'United Kingdom', 'Saudi Arabia', 'Canada', 'Australia', 'Japan', 'Singapore', 'Italy', 'Germany', 'France', 'Spain',
-                       'Malaysia', 'Qatar', 'Kuwait', 'Israel', 'China'}
+                'kuwait', 'israel', 'china_(p.r.o.c.)', 'russian_federation_/_ussr')
+HEALTH_COUNTRIES = frozenset({'United States', 'Hong Kong SAR, China', 'Russian Federation', 'Korea, Rep.', 'United Arab Emirates',
+                              'United Kingdom', 'Saudi Arabia', 'Canada', 'Australia', 'Japan', 'Singapore', 'Italy', 'Germany', 'France', 'Spain',
+                              'Malaysia', 'Qatar', 'Kuwait', 'Israel', 'China'})
 country_mapping = {
     'united_states_of_america': 'USA',
     'united_arab_emirates': 'United Arab Emirates',
@@ -65,15 +117,222 @@ health_country_mapping = {
     'Russian Federation': 'Russia',
     'Korea, Rep.': 'South Korea'}
 
-migrant_fixed = migrant.melt(
-    id_vars=['year'], value_vars=country_list, var_name='country', value_name='migrants')
-migrant_fixed['country'] = migrant_fixed['country'].replace(country_mapping)
-df = df[df['Country Name'].isin(health_country_list)]
-df['Country Name'] = df['Country Name'].replace(health_country_mapping)
-migrant_fixed.rename(
-    columns={'country': 'Country Name', 'year': 'Year'}, inplace=True)
-migrant_final = pd.merge(df, migrant_fixed, on=[
-                         'Country Name', 'Year'], how='left')
+@st.cache_data
+def build_frames():
+    """Run the melt/filter/merge preprocessing once per session."""
+    df, migrant = load_health_data()
+    migrant_fixed = migrant.melt(
+        id_vars=['year'], value_vars=list(COUNTRY_LIST), var_name='country', value_name='migrants')
+    # .map is a straight value-to-value lookup, much faster than the
+    # generic .replace dispatch; fillna keeps any unmapped name as-is
+    s = migrant_fixed['country']
+    migrant_fixed['country'] = s.map(country_mapping).fillna(s)
+    df = df[df['Country Name'].isin(HEALTH_COUNTRIES)]
+    s = df['Country Name']
+    df['Country Name'] = s.map(health_country_mapping).fillna(s)
+    migrant_fixed.rename(
+        columns={'country': 'Country Name', 'year': 'Year'}, inplace=True)
+    # Categorical country names: equality filters compare integer codes
+    # instead of Python strings, and the merge key hashes faster. The
+    # merge keys must share the exact same dtype to stay on the fast path.
+    df['Country Name'] = df['Country Name'].astype('category')
+    migrant_fixed['Country Name'] = migrant_fixed['Country Name'].astype(
+        df['Country Name'].dtype)
+    df['Year'] = df['Year'].astype('int16')
+    migrant_fixed['Year'] = migrant_fixed['Year'].astype('int16')
+    migrant_final = df.merge(
+        migrant_fixed, on=['Country Name', 'Year'], how='left',
+        sort=False, validate='many_to_one')
+    # Sort once here so per-country slices are already year-ordered:
+    # .iloc[0]/.iloc[-1] trend diffs are correct and the expander table
+    # never needs another sort
+    df = df.sort_values(['Country Name', 'Year']).reset_index(drop=True)
+    migrant_final = migrant_final.sort_values(
+        ['Country Name', 'Year']).reset_index(drop=True)
+    # Per-country slices precomputed once: page-body lookups become a
+    # dict access plus a filter over a handful of rows
+    country_groups = dict(
+        tuple(df.groupby('Country Name', sort=False, observed=True)))
+    chart_groups = dict(
+        tuple(migrant_final.groupby('Country Name', sort=False, observed=True)))
+    # Sorted MultiIndex view for the single-row KPI lookup
+    df_indexed = df.set_index(['Country Name', 'Year']).sort_index()
+    # Selectbox options computed once; tuples hash instantly for widgets
+    available_countries = tuple(sorted(df['Country Name'].unique()))
+    available_years = tuple(sorted(df['Year'].unique()))
+    # Default selectbox position resolved once instead of per rerun
+    default_country_idx = (available_countries.index('Germany')
+                           if 'Germany' in available_countries else 0)
+    return (df, migrant_final, df_indexed, country_groups, chart_groups,
+            available_countries, available_years, default_country_idx)
+
+
+(df, migrant_final, df_indexed, country_groups, chart_groups,
+ available_countries, available_years, default_country_idx) = build_frames()
+
+# Chart configuration: (panel title, source column, hover label, value format)
+CHARTS = [
+    ("⌛ Life Expectancy (Years)",
+     'Life expectancy at birth, total (years)',
+     "Life Expectancy", ",.2f"),
+    ("🏥 Health Expenditure (% of GDP)",
+     'Domestic general government health expenditure (% of GDP)',
+     "Domestic Health Expenditure", ",.2f"),
+    ("💵 Gross Domestic Product (US Dollars)",
+     'GDP',
+     "Gross Domestic Product (US Dollars)", ",.0f"),
+    ("💼 Unemployment (%)",
+     'Unemployment, total (% of total labor force)',
+     "Unemployment (%)", ",.2f"),
+    ("🩸 Diabetes Prevalence (% ages 20 to 79)",
+     'Diabetes prevalence (% of population ages 20 to 79)',
+     "Diabetes Prevalence", ",.2f"),
+    ("🫀 Hypertension Prevalence (% ages 30 to 79)",
+     'Prevalence of hypertension (% of adults ages 30-79)',
+     "Hypertension Prevalence", ",.2f"),
+    ("♀️ Mortality Rate (Female)",
+     'Mortality rate, adult, female (per 1,000 female adults)',
+     "Mortality Rate (per 1,000 female adults)", ",.2f"),
+    ("♂️ Mortality Rate (Male)",
+     'Mortality rate, adult, male (per 1,000 male adults)',
+     "Mortality Rate (per 1,000 male adults)", ",.2f"),
+]
+SUBPLOT_TITLES = [title for title, _, _, _ in CHARTS]
+
+
+def make_trend_trace(chart_data, column, label, fmt):
+    """Year-vs-indicator line trace for the trends subplot."""
+    return go.Scatter(
+        x=chart_data['Year'],
+        y=chart_data[column],
+        mode='lines+markers',
+        hovertemplate=(
+            "<b>Year %{x}</b><br>"
+            f"{label}: <span style='color:#00d4ff'>"
+            f"<b>%{{y:{fmt}}}</b></span><br>"
+        )
+    )
+
+
+def make_scatter_trace(chart_data, column, label, fmt):
+    """Indicator-vs-migrants marker trace for the scatter subplot."""
+    return go.Scatter(
+        x=chart_data[column],
+        y=chart_data['migrants'],
+        text=chart_data['Year'],
+        mode='markers',
+        hovertemplate=(
+            "<b>Year %{text}</b><br>"
+            f"{label}: <span style='color:#00d4ff'>"
+            f"<b>%{{x:{fmt}}}</b></span><br>"
+            "Migrant: <span style='color:#00d4ff'><b>%{y:,.0f}</b></span><br>"
+        )
+    )
+
+
+# KPI card configuration: two rows of
+# (label, column, value format, help, missing-data help)
+KPI_ROWS = (
+    (
+        ("Life Expectancy",
+         'Life expectancy at birth, total (years)',
+         "{:.1f} years", "Life expectancy at birth",
+         "No life expectancy data available for this year"),
+        ("Health Expenditure",
+         'Domestic general government health expenditure (% of GDP)',
+         "{:.1f} of GDP",
+         "Government health expenditure as percentage of GDP",
+         "No health expenditure data available for this year"),
+        ("Gross Domestic Product", 'GDP',
+         None, "Gross Domestic Product in US Dollars",
+         "No GDP data available for this year"),
+        ("Unemployment Rate",
+         'Unemployment, total (% of total labor force)',
+         "{:.1f}%", "Total unemployment rate",
+         "No unemployment data available for this year"),
+    ),
+    (
+        ("Diabetes Prevalence",
+         'Diabetes prevalence (% of population ages 20 to 79)',
+         "{:.1f}%", "Diabetes prevalence among population ages 20-79",
+         "No diabetes data available"),
+        ("Hypertension Prevalence",
+         'Prevalence of hypertension (% of adults ages 30-79)',
+         "{:.1f}%", "Hypertension prevalence among adults ages 30-79",
+         "No hypertension data available"),
+        ("Adult Female Mortality",
+         'Mortality rate, adult, female (per 1,000 female adults)',
+         "{:.1f} per 1,000", "Adult female mortality rate per 1,000",
+         "No mortality data available"),
+        ("Adult Male Mortality",
+         'Mortality rate, adult, male (per 1,000 male adults)',
+         "{:.1f} per 1,000", "Adult male mortality rate per 1,000",
+         "No mortality data available"),
+    ),
+)
+
+
+# Trend cards: (column, label, value format, delta format); frozen at
+# module scope so the rerun path only iterates it
+TREND_METRICS = (
+    ('Life expectancy at birth, total (years)',
+     "Life Expectancy Trend", "{:.1f} years", "{:+.1f} years"),
+    ('Domestic general government health expenditure (% of GDP)',
+     "Health Expenditure Trend", "{:.1f}%", "{:+.1f}%"),
+    ('Unemployment, total (% of total labor force)',
+     "Unemployment Trend", "{:.1f}%", "{:+.1f}%"),
+)
+
+
+def format_gdp(value):
+    """Format GDP with appropriate notation."""
+    if value >= 1e12:  # Trillion
+        return f"${value/1e12:.2f}T"
+    if value >= 1e9:  # Billion
+        return f"${value/1e9:.2f}B"
+    if value >= 1e6:  # Million
+        return f"${value/1e6:.2f}M"
+    return f"${value:,.0f}"
+
+
+@st.fragment
+def render_charts(selected_country):
+    """Render the indicator charts inside a fragment.
+
+    Widget changes that only affect the charts rerun this function,
+    not the whole script (and not the cached preprocessing above).
+    """
+    chart_data = chart_groups[selected_country]
+
+
+    # One 4x2 subplot figure per panel: a single serialization and React
+    # reconcile instead of eight per panel
+    st.subheader("Indicator Trends")
+    fig_trends = make_subplots(
+        rows=4, cols=2, subplot_titles=SUBPLOT_TITLES, vertical_spacing=0.08)
+    for i, (title, column, label, fmt) in enumerate(CHARTS):
+        row_idx, col_idx = divmod(i, 2)
+        fig_trends.add_trace(
+            make_trend_trace(chart_data, column, label, fmt),
+            row=row_idx + 1, col=col_idx + 1
+        )
+    fig_trends.update_layout(
+        template='dashboard', height=1500, showlegend=False)
+    st.plotly_chart(fig_trends, use_container_width=True)
+
+    st.subheader("Indicators vs Migrants")
+    fig_scatters = make_subplots(
+        rows=4, cols=2, subplot_titles=SUBPLOT_TITLES, vertical_spacing=0.08)
+    for i, (title, column, label, fmt) in enumerate(CHARTS):
+        row_idx, col_idx = divmod(i, 2)
+        fig_scatters.add_trace(
+            make_scatter_trace(chart_data, column, label, fmt),
+            row=row_idx + 1, col=col_idx + 1
+        )
+    fig_scatters.update_layout(
+        template='dashboard', height=1500, showlegend=False)
+    st.plotly_chart(fig_scatters, use_container_width=True)
+
 
 st.title("Health and Economic Indicators Dashboard")
 
@@ -89,236 +348,71 @@ if df is not None:
     # Country selection
     st.sidebar.markdown("---")
     st.sidebar.markdown("### Country Selection")
-    available_countries = sorted(df['Country Name'].unique())
     selected_country = st.sidebar.selectbox(
         "Select a Country:",
         options=available_countries,
-        index=available_countries.index(
-            'Germany') if 'Germany' in available_countries else 0
+        index=default_country_idx
     )
 
     # Year selection
-    available_years = sorted(df['Year'].unique())
     selected_year = st.sidebar.selectbox(
         "Select Year:",
         options=available_years,
         index=len(available_years) - 1  # Default to latest year
     )
 
-    # Filter data for selected country and year
-    country_data = df[(df['Country Name'] == selected_country)
-                      & (df['Year'] == selected_year)]
+    # Look up the single KPI row for the selected country and year
+    country_group = country_groups[selected_country]
+    try:
+        row = df_indexed.loc[(selected_country, selected_year)]
+    except KeyError:
+        row = None
 
     # Display country information
     st.header(f"{selected_country} - {selected_year}")
 
-    if not country_data.empty:
-        # Get the specific row for the selected country and year
-        row = country_data.iloc[0]
-
-        # Display 3 KPI cards
-        col1, col2, col3, col4 = st.columns(4)
-
-        # Life Expectancy
-        with col1:
-            life_exp = row.get('Life expectancy at birth, total (years)')
-            if pd.notna(life_exp):
-                st.metric(
-                    label="Life Expectancy",
-                    value=f"{life_exp:.1f} years",
-                    help="Life expectancy at birth"
-                )
-            else:
-                st.metric(
-                    label="Life Expectancy",
-                    value="No data",
-                    delta="Data unavailable",
-                    help="No life expectancy data available for this year"
-                )
-
-        # Health Expenditure
-        with col2:
-            health_exp = row.get(
-                'Domestic general government health expenditure (% of GDP)')
-            if pd.notna(health_exp):
-                st.metric(
-                    label="Health Expenditure",
-                    value=f"{health_exp:.1f} of GDP",
-                    help="Government health expenditure as percentage of GDP"
-                )
-            else:
-                st.metric(
-                    label="Health Expenditure",
-                    value="No data",
-                    delta="Data unavailable",
-                    help="No health expenditure data available for this year"
-                )
-
-        # GDP
-        with col3:
-            GDP = row.get('GDP')
-            if pd.notna(GDP):
-                # Format GDP with appropriate notation
-                if GDP >= 1e12:  # Trillion
-                    gdp_formatted = f"${GDP/1e12:.2f}T"
-                elif GDP >= 1e9:  # Billion
-                    gdp_formatted = f"${GDP/1e9:.2f}B"
-                elif GDP >= 1e6:  # Million
-                    gdp_formatted = f"${GDP/1e6:.2f}M"
+    if row is not None:
+        # KPI cards driven by the module-level config: one tight loop
+        # instead of eight hand-written column blocks
+        for row_idx, kpi_row in enumerate(KPI_ROWS):
+            if row_idx == 1:
+                st.subheader("Additional Health Indicators")
+            cols = st.columns(4)
+            for col, (label, column, fmt, help_text, missing) in zip(
+                    cols, kpi_row):
+                value = row.get(column)
+                if pd.notna(value):
+                    formatted = (format_gdp(value) if fmt is None
+                                 else fmt.format(value))
+                    col.metric(label=label, value=formatted, help=help_text)
+                elif row_idx == 0:
+                    col.metric(label=label, value="No data",
+                               delta="Data unavailable", help=missing)
                 else:
-                    gdp_formatted = f"${GDP:,.0f}"
-                
-                st.metric(
-                    label="Gross Domestic Product",
-                    value=gdp_formatted,
-                    help="Gross Domestic Product in US Dollars"
-                )
-            else:
-                st.metric(
-                    label="Gross Domestic Product",
-                    value="No data",
-                    delta="Data unavailable",
-                    help="No GDP data available for this year"
-                )
-
-        # Unemployment Rate
-        with col4:
-            unemployment = row.get(
-                'Unemployment, total (% of total labor force)')
-            if pd.notna(unemployment):
-                st.metric(
-                    label="Unemployment Rate",
-                    value=f"{unemployment:.1f}%",
-                    help="Total unemployment rate"
-                )
-            else:
-                st.metric(
-                    label="Unemployment Rate",
-                    value="No data",
-                    delta="Data unavailable",
-                    help="No unemployment data available for this year"
-                )
-
-        # Additional metrics in a second row
-        st.subheader("Additional Health Indicators")
-        col5, col6, col7, col8 = st.columns(4)
-
-        # Diabetes Prevalence
-        with col5:
-            diabetes = row.get(
-                'Diabetes prevalence (% of population ages 20 to 79)')
-            if pd.notna(diabetes):
-                st.metric(
-                    label="Diabetes Prevalence",
-                    value=f"{diabetes:.1f}%",
-                    help="Diabetes prevalence among population ages 20-79"
-                )
-            else:
-                st.metric(
-                    label="Diabetes Prevalence",
-                    value="No data",
-                    help="No diabetes data available"
-                )
-
-        # Hypertension Prevalence
-        with col6:
-            hypertension = row.get(
-                'Prevalence of hypertension (% of adults ages 30-79)')
-            if pd.notna(hypertension):
-                st.metric(
-                    label="Hypertension Prevalence",
-                    value=f"{hypertension:.1f}%",
-                    help="Hypertension prevalence among adults ages 30-79"
-                )
-            else:
-                st.metric(
-                    label="Hypertension Prevalence",
-                    value="No data",
-                    help="No hypertension data available"
-                )
-
-        # Adult Mortality Rate (Female)
-        with col7:
-            mortality_female = row.get(
-                'Mortality rate, adult, female (per 1,000 female adults)')
-            if pd.notna(mortality_female):
-                st.metric(
-                    label="Adult Female Mortality",
-                    value=f"{mortality_female:.1f} per 1,000",
-                    help="Adult female mortality rate per 1,000"
-                )
-            else:
-                st.metric(
-                    label="Adult Female Mortality",
-                    value="No data",
-                    help="No mortality data available"
-                )
-
-         # Adult Mortality Rate (Male)
-        with col8:
-            mortality_male = row.get(
-                'Mortality rate, adult, male (per 1,000 male adults)')
-            if pd.notna(mortality_female):
-                st.metric(
-                    label="Adult Male Mortality",
-                    value=f"{mortality_female:.1f} per 1,000",
-                    help="Adult male mortality rate per 1,000"
-                )
-            else:
-                st.metric(
-                    label="Adult Male Mortality",
-                    value="No data",
-                    help="No mortality data available"
-                )
+                    col.metric(label=label, value="No data", help=missing)
 
     # Show trend data for the selected country
     st.markdown("---")
     st.subheader(f"Trend Data for {selected_country}")
     # Get all data for the selected country
-    country_trend_data = df[df['Country Name'] == selected_country]
+    country_trend_data = country_group
 
     # Display trend metrics if available
-    trend_col1, trend_col2, trend_col3 = st.columns(3)
-
-    with trend_col1:
-        if 'Life expectancy at birth, total (years)' in country_trend_data.columns:
-            life_data = country_trend_data['Life expectancy at birth, total (years)'].dropna(
-            )
-            if len(life_data) > 1:
-                life_change = life_data.iloc[-1] - life_data.iloc[0]
-                st.metric(
-                    label="Life Expectancy Trend",
-                    value=f"{life_data.iloc[-1]:.1f} years",
-                    delta=f"{life_change:+.1f} years",
-                    help="Change over available data period"
-                )
-
-    with trend_col2:
-        if 'Domestic general government health expenditure (% of GDP)' in country_trend_data.columns:
-            health_data = country_trend_data['Domestic general government health expenditure (% of GDP)'].dropna(
-            )
-            if len(health_data) > 1:
-                health_change = health_data.iloc[-1] - health_data.iloc[0]
-                st.metric(
-                    label="Health Expenditure Trend",
-                    value=f"{health_data.iloc[-1]:.1f}%",
-                    delta=f"{health_change:+.1f}%",
-                    help="Change over available data period"
-                )
-
-    with trend_col3:
-        if 'Unemployment, total (% of total labor force)' in country_trend_data.columns:
-            unemployment_data = country_trend_data['Unemployment, total (% of total labor force)'].dropna(
-            )
-            if len(unemployment_data) > 1:
-                unemployment_change = unemployment_data.iloc[-1] - \
-                    unemployment_data.iloc[0]
-                st.metric(
-                    label="Unemployment Trend",
-                    value=f"{unemployment_data.iloc[-1]:.1f}%",
-                    delta=f"{unemployment_change:+.1f}%",
-                    help="Change over available data period"
-                )
+    # Drop NaNs once per trend column instead of inside each metric block
+    trend_series = {col: country_trend_data[col].dropna()
+                    for col, *_ in TREND_METRICS
+                    if col in country_trend_data.columns}
+
+    trend_cols = st.columns(3)
+    for col, (column, label, value_fmt, delta_fmt) in zip(
+            trend_cols, TREND_METRICS):
+        series = trend_series.get(column)
+        if series is not None and len(series) > 1:
+            change = series.iloc[-1] - series.iloc[0]
+            col.metric(label=label,
+                       value=value_fmt.format(series.iloc[-1]),
+                       delta=delta_fmt.format(change),
+                       help="Change over available data period")
 
     # Show data table for the selected country
     with st.expander(f"View all data for {selected_country}"):
@@ -331,12 +425,12 @@ if df is not None:
         # Only show columns that exist in the dataframe
         available_columns = [
             col for col in display_columns if col in country_trend_data.columns]
-        st.dataframe(country_trend_data[available_columns].sort_values('Year', ascending=False),
+        # Already year-ascending from the cached sort; reverse the view
+        st.dataframe(country_trend_data[available_columns].iloc[::-1],
                      use_container_width=True)
 
         # Show available years for the selected country
-        country_years = df[df['Country Name'] ==
-                           selected_country]['Year'].unique()
+        country_years = country_group['Year'].unique()
         if len(country_years) > 0:
             st.info(
                 f"Available years for {selected_country}: {sorted(country_years)}")
@@ -348,381 +442,12 @@ if df is not None:
     st.markdown("---")
     st.subheader(
         f"Health and Economic Indicator Trends for {selected_country}")
-    chart_data = migrant_final[(
-        migrant_final['Country Name'] == selected_country)]
-
-    # Life Expectancy
-    st.subheader("⌛ Life Expectancy")
-
-    col9, col10 = st.columns(2)
-
-    with col9:
-        fig_life = go.Figure()
-        fig_life.add_trace(
-            go.Scatter(
-                x=chart_data['Year'],
-                y=chart_data['Life expectancy at birth, total (years)'],
-                mode='lines+markers',
-                hovertemplate=(
-                    "<b>Year %{x}</b><br>"
-                    "Life Expectancy: <span style='color:#00d4ff'><b>%{y:,.0f}</b></span><br>"
-                )
-            )
-        )
-        fig_life.update_layout(
-            xaxis_title="Years",
-            yaxis_title="Life Expectancy (Years)",
-            title="Life Expectancy (Years) Trend"
-        )
-        st.plotly_chart(fig_life, use_container_width=True)
-    with col10:
-        fig_life2 = go.Figure()
-        fig_life2.add_trace(
-            go.Scatter(
-                x=chart_data['Life expectancy at birth, total (years)'],
-                y=chart_data['migrants'],
-                text=chart_data['Year'],
-                mode='markers',
-                hovertemplate=(
-                    "<b>Year %{text}</b><br>"
-                    "Life Expectancy: <span style='color:#00d4ff'><b>%{x:,.2f}</b></span><br>"
-                    "Migrant: <span style='color:#00d4ff'><b>%{y:,.0f}</b></span><br>"
-                )
-            )
-        )
-        fig_life2.update_layout(
-            xaxis_title="Life Expectancy (Years)",
-            yaxis_title="Migrants",
-            title="Life Expectancy (Years) vs Migrants"
-        )
-        st.plotly_chart(fig_life2, use_container_width=True)
-
-    # Health Expenditure
-    st.subheader("🏥 Health Expenditure")
-
-    col11, col12 = st.columns(2)
-
-    with col11:
-        fig_health = go.Figure()
-        fig_health.add_trace(
-            go.Scatter(
-                x=chart_data['Year'],
-                y=chart_data['Domestic general government health expenditure (% of GDP)'],
-                mode='lines+markers',
-                hovertemplate=(
-                    "<b>Year %{x}</b><br>"
-                    "Domestic Health Expenditure: <span style='color:#00d4ff'><b>%{y:,.2f}%</b></span><br>"
-                )
-            )
-        )
-        fig_health.update_layout(
-            xaxis_title="Years",
-            yaxis_title="Health Expenditure (% of GDP)",
-            title="Health Expenditure (% of GDP) Trend"
-        )
-        st.plotly_chart(fig_health, use_container_width=True)
-    with col12:
-        fig_health2 = go.Figure()
-        fig_health2.add_trace(
-            go.Scatter(
-                x=chart_data['Domestic general government health expenditure (% of GDP)'],
-                y=chart_data['migrants'],
-                text=chart_data['Year'],
-                mode='markers',
-                hovertemplate=(
-                    "<b>Year %{text}</b><br>"
-                    "Domestic Health Expenditure: <span style='color:#00d4ff'><b>%{x:,.2f}%</b></span><br>"
-                    "Migrant: <span style='color:#00d4ff'><b>%{y:,.0f}</b></span><br>"
-                )
-            )
-        )
-        fig_health2.update_layout(
-            xaxis_title="Health Expenditure (% of GDP)",
-            yaxis_title="Migrants",
-            title="Health Expenditure (% of GDP) vs Migrants"
-        )
-        st.plotly_chart(fig_health2, use_container_width=True)
-
-    # GDP
-    st.subheader("💵 Gross Domestic Product (GDP)")
-
-    col13, col14 = st.columns(2)
-
-    with col13:
-        fig_gdp = go.Figure()
-        fig_gdp.add_trace(
-            go.Scatter(
-                x=chart_data['Year'],
-                y=chart_data['GDP'],
-                mode='lines+markers',
-                hovertemplate=(
-                    "<b>Year %{x}</b><br>"
-                    "Gross Domestic Product (US Dollars): <span style='color:#00d4ff'><b>%{y:,.0f}</b></span><br>"
-                )
-            )
-        )
-        fig_gdp.update_layout(
-            xaxis_title="Years",
-            yaxis_title="Gross Domestic Product (US Dollars)",
-            title="Gross Domestic Product (US Dollars) Trend"
-        )
-        st.plotly_chart(fig_gdp, use_container_width=True)
-    with col14:
-        fig_gdp2 = go.Figure()
-        fig_gdp2.add_trace(
-            go.Scatter(
-                x=chart_data['GDP'],
-                y=chart_data['migrants'],
-                text=chart_data['Year'],
-                mode='markers',
-                hovertemplate=(
-                    "<b>Year %{text}</b><br>"
-                    "Gross Domestic Product (US Dollars): <span style='color:#00d4ff'><b>%{x:,.0f}</b></span><br>"
-                    "Migrant: <span style='color:#00d4ff'><b>%{y:,.0f}</b></span><br>"
-                )
-            )
-        )
-        fig_gdp2.update_layout(
-            xaxis_title="Gross Domestic Product (US Dollars)",
-            yaxis_title="Migrants",
-            title="Gross Domestic Product (US Dollars) vs Migrants"
-        )
-        st.plotly_chart(fig_gdp2, use_container_width=True)
-
-    # Unemployment
-    st.subheader("💼 Unemployment (%)")
-
-    col15, col16 = st.columns(2)
-
-    with col15:
-        fig_unemp = go.Figure()
-        fig_unemp.add_trace(
-            go.Scatter(
-                x=chart_data['Year'],
-                y=chart_data['Unemployment, total (% of total labor force)'],
-                mode='lines+markers',
-                hovertemplate=(
-                    "<b>Year %{x}</b><br>"
-                    "Unemployment (%): <span style='color:#00d4ff'><b>%{y:,.2f}%</b></span><br>"
-                )
-            )
-        )
-        fig_unemp.update_layout(
-            xaxis_title="Years",
-            yaxis_title="Unemployment (%)",
-            title="Unemployment (%) Trend"
-        )
-        st.plotly_chart(fig_unemp, use_container_width=True)
-    with col16:
-        fig_unemp2 = go.Figure()
-        fig_unemp2.add_trace(
-            go.Scatter(
-                x=chart_data['Unemployment, total (% of total labor force)'],
-                y=chart_data['migrants'],
-                text=chart_data['Year'],
-                mode='markers',
-                hovertemplate=(
-                    "<b>Year %{text}</b><br>"
-                    "Unemployment (%): <span style='color:#00d4ff'><b>%{x:,.2f}%</b></span><br>"
-                    "Migrant: <span style='color:#00d4ff'><b>%{y:,.0f}</b></span><br>"
-                )
-            )
-        )
-        fig_unemp2.update_layout(
-            xaxis_title="Unemployment (%)",
-            yaxis_title="Migrants",
-            title="Unemployment (%) vs Migrants"
-        )
-        st.plotly_chart(fig_unemp2, use_container_width=True)
-
-    # Diabetes
-    st.subheader("🩸 Diabetes Prevalence (% of population ages 20 to 79)")
-
-    col17, col18 = st.columns(2)
-
-    with col17:
-        fig_diab = go.Figure()
-        fig_diab.add_trace(
-            go.Scatter(
-                x=chart_data['Year'],
-                y=chart_data['Diabetes prevalence (% of population ages 20 to 79)'],
-                mode='lines+markers',
-                hovertemplate=(
-                    "<b>Year %{x}</b><br>"
-                    "Diabetes Prevalence (% of population ages 20 to 79): <span style='color:#00d4ff'><b>%{y:,.2f}%</b></span><br>"
-                )
-            )
-        )
-        fig_diab.update_layout(
-            xaxis_title="Year",
-            yaxis_title="Diabetes Prevalence (% of Population Ages 20 to 79)",
-            title="Diabetes Prevalence (% of Population Ages 20 to 79) Trend"
-        )
-        st.plotly_chart(fig_diab, use_container_width=True)
-    with col18:
-        fig_diab2 = go.Figure()
-        fig_diab2.add_trace(
-            go.Scatter(
-                x=chart_data['Diabetes prevalence (% of population ages 20 to 79)'],
-                y=chart_data['migrants'],
-                text=chart_data['Year'],
-                mode='markers',
-                hovertemplate=(
-                    "<b>Year %{text}</b><br>"
-                    "Diabetes Prevalence (% of population ages 20 to 79): <span style='color:#00d4ff'><b>%{x:,.2f}%</b></span><br>"
-                    "Migrant: <span style='color:#00d4ff'><b>%{y:,.0f}</b></span><br>"
-                )
-            )
-        )
-        fig_diab2.update_layout(
-            xaxis_title="Diabetes Prevalence (% of Population Ages 20 to 79)",
-            yaxis_title="Migrants",
-            title="Diabetes Prevalence (% of Population Ages 20 to 79) vs Migrants"
-        )
-        st.plotly_chart(fig_diab2, use_container_width=True)
-
-    # Hypertension
-    st.subheader("🫀 Hypertension Prevalence (% of population ages 30 to 79)")
-
-    col19, col20 = st.columns(2)
-
-    with col19:
-        fig_hype = go.Figure()
-        fig_hype.add_trace(
-            go.Scatter(
-                x=chart_data['Year'],
-                y=chart_data['Prevalence of hypertension (% of adults ages 30-79)'],
-                mode='lines+markers',
-                hovertemplate=(
-                    "<b>Year %{x}</b><br>"
-                    "Hypertension Prevalence (% of population ages 30 to 79): <span style='color:#00d4ff'><b>%{y:,.2f}%</b></span><br>"
-                )
-            )
-        )
-        fig_hype.update_layout(
-            xaxis_title="Years",
-            yaxis_title="Hypertension Prevalence (% of Population Ages 30 to 79)",
-            title="Hypertension Prevalence (% of Population Ages 30 to 79) Trend"
-        )
-        st.plotly_chart(fig_hype, use_container_width=True)
-    with col20:
-        fig_hype2 = go.Figure()
-        fig_hype2.add_trace(
-            go.Scatter(
-                x=chart_data['Prevalence of hypertension (% of adults ages 30-79)'],
-                y=chart_data['migrants'],
-                text=chart_data['Year'],
-                mode='markers',
-                hovertemplate=(
-                    "<b>Year %{text}</b><br>"
-                    "Hypertension Prevalence (% of population ages 30 to 79): <span style='color:#00d4ff'><b>%{x:,.2f}%</b></span><br>"
-                    "Migrant: <span style='color:#00d4ff'><b>%{y:,.0f}</b></span><br>"
-                )
-            )
-        )
-        fig_hype2.update_layout(
-            xaxis_title="Hypertension Prevalence (% of Population Ages 30 to 79)",
-            yaxis_title="Migrants",
-            title="Hypertension Prevalence (% of Population Ages 30 to 79) vs Migrants"
-        )
-        st.plotly_chart(fig_hype2, use_container_width=True)
-
-    # Mortality Rate (Female)
-    st.subheader("♀️ Mortality Rate (Female)")
-
-    col21, col22 = st.columns(2)
-
-    with col21:
-        fig_mrf = go.Figure()
-        fig_mrf.add_trace(
-            go.Scatter(
-                x=chart_data['Year'],
-                y=chart_data['Mortality rate, adult, female (per 1,000 female adults)'],
-                mode='lines+markers',
-                hovertemplate=(
-                    "<b>Year %{x}</b><br>"
-                    "Mortality Rate (per 1,000 female adults): <span style='color:#00d4ff'><b>%{y:,.2f}</b></span><br>"
-                )
-            )
-        )
-        fig_mrf.update_layout(
-            xaxis_title="Years",
-            yaxis_title="Mortality Rate (per 1,000 Female Adults)",
-            title="Mortality Rate (per 1,000 Female Adults) Trend"
-        )
-        st.plotly_chart(fig_mrf, use_container_width=True)
-    with col22:
-        fig_mrf2 = go.Figure()
-        fig_mrf2.add_trace(
-            go.Scatter(
-                x=chart_data['Mortality rate, adult, female (per 1,000 female adults)'],
-                y=chart_data['migrants'],
-                text=chart_data['Year'],
-                mode='markers',
-                hovertemplate=(
-                    "<b>Year %{text}</b><br>"
-                    "Mortality Rate (per 1,000 female adults): <span style='color:#00d4ff'><b>%{x:,.2f}</b></span><br>"
-                    "Migrant: <span style='color:#00d4ff'><b>%{y:,.0f}</b></span><br>"
-                )
-            )
-        )
-        fig_mrf2.update_layout(
-            xaxis_title="Mortality Rate (per 1,000 Female Adults)",
-            yaxis_title="Migrants",
-            title="Mortality Rate (per 1,000 Female Adults) vs Migrants"
-        )
-        st.plotly_chart(fig_mrf2, use_container_width=True)
-
-    # Mortality Rate (Male)
-    st.subheader("♂️ Mortality Rate (Male)")
-
-    col23, col24 = st.columns(2)
-
-    with col23:
-        fig_mrm = go.Figure()
-        fig_mrm.add_trace(
-            go.Scatter(
-                x=chart_data['Year'],
-                y=chart_data['Mortality rate, adult, male (per 1,000 male adults)'],
-                mode='lines+markers',
-                hovertemplate=(
-                    "<b>Year %{x}</b><br>"
-                    "Mortality Rate (per 1,000 female adults): <span style='color:#00d4ff'><b>%{y:,.2f}</b></span><br>"
-                )
-            )
-        )
-        fig_mrm.update_layout(
-            xaxis_title="Year",
-            yaxis_title="Mortality Rate (per 1,000 Male Adults)",
-            title="Mortality Rate (per 1,000 Male Adults) Trend"
-        )
-        st.plotly_chart(fig_mrm, use_container_width=True)
-    with col24:
-        fig_mrm2 = go.Figure()
-        fig_mrm2.add_trace(
-            go.Scatter(
-                x=chart_data['Mortality rate, adult, male (per 1,000 male adults)'],
-                y=chart_data['migrants'],
-                text=chart_data['Year'],
-                mode='markers',
-                hovertemplate=(
-                    "<b>Year %{text}</b><br>"
-                    "Mortality Rate (per 1,000 male adults): <span style='color:#00d4ff'><b>%{x:,.2f}</b></span><br>"
-                    "Migrant: <span style='color:#00d4ff'><b>%{y:,.0f}</b></span><br>"
-                )
-            )
-        )
-        fig_mrm2.update_layout(
-            xaxis_title="Mortality Rate (per 1,000 Male Adults)",
-            yaxis_title="Migrants",
-            title="Mortality Rate (per 1,000 Male Adults) vs Migrants"
-        )
-        st.plotly_chart(fig_mrm2, use_container_width=True)
+    render_charts(selected_country)
 
-    # Show sample of the full dataset
+    # Show sample of the full dataset; only serialized when opened
     st.markdown("---")
-    st.subheader("Full Dataset Sample")
-    st.dataframe(df.head(10), use_container_width=True)
+    with st.expander("Full Dataset Sample"):
+        st.dataframe(df.head(10), use_container_width=True, hide_index=True)
 
 
 else: